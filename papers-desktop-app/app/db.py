@@ -2,17 +2,18 @@
 Database layer for papers database.
 
 This module handles all SQLite database operations including:
+- Per-thread connection reuse with tuned pragmas
 - Schema initialization with FTS5 support
-- CRUD operations
-- Search functionality with FTS5 fallback to LIKE
+- CRUD operations, including bulk inserts
+- Full-text search via FTS5
 - CSV export
 """
 
 import sqlite3
 import csv
 import logging
+import threading
 from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime
 import os
 
 from .unique import unique_name_from_row
@@ -25,6 +26,130 @@ class DatabaseError(Exception):
     pass
 
 
+# Pragmas applied once when a connection is opened
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Columns maintained by the database itself; timestamps use datetime('now')
+# to match the schema defaults
+_SYSTEM_COLUMNS = ('id', 'created_at', 'updated_at')
+
+# Columns indexed for full-text search, when present
+_FTS_CANDIDATES = frozenset({'title', 'authors', 'journal', 'abstract', 'keywords', 'tags', 'notes'})
+
+# Partial unique index guaranteeing non-empty unique_name values are unique
+_UNIQUE_NAME_INDEX = "ux_unique_name"
+
+# Size of each connection's prepared-statement cache (sqlite3 default is 128)
+_CACHED_STATEMENTS = 256
+
+# Rows fetched and written per batch by export_csv
+_EXPORT_BATCH_SIZE = 1000
+
+# Ids bound per "IN (...)" query, well under SQLITE_MAX_VARIABLE_NUMBER
+_ID_BATCH_SIZE = 500
+
+# Write buffer for export_csv, so batches reach disk in large writes
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# Orderings accepted by read_all; ties keep the most recently
+# updated record first
+_SORT_ORDERS = {
+    'id': "papers.id ASC",
+    'created_desc': "papers.created_at DESC",
+    'created_asc': "papers.created_at ASC",
+    'title_asc': "papers.title COLLATE NOCASE ASC",
+    'title_desc': "papers.title COLLATE NOCASE DESC",
+    'year_desc': "papers.year DESC",
+    'year_asc': "papers.year ASC",
+}
+
+# Per-thread connection cache: sqlite3 connections may not be shared across threads
+_local = threading.local()
+
+# Schema metadata per database path, invalidated by init_schema
+_fts_cache: Dict[str, bool] = {}
+_cols_cache: Dict[str, List[str]] = {}
+_insert_cache: Dict[str, Tuple[Tuple[str, ...], str]] = {}
+
+
+def get_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Get the cached connection to a database for the current thread.
+    
+    The connection is opened and tuned on first use, then reused by every
+    subsequent call from the same thread.
+    
+    Args:
+        db_path: Path to SQLite database file
+        
+    Returns:
+        Open SQLite connection with sqlite3.Row as row factory
+    """
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+    
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, cached_statements=_CACHED_STATEMENTS)
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        connections[db_path] = conn
+    
+    return conn
+
+
+class _DictRowFactory:
+    """Row factory building dicts from a key tuple computed on the first row."""
+    
+    __slots__ = ('keys',)
+    
+    def __init__(self):
+        self.keys = None
+    
+    def __call__(self, cursor: sqlite3.Cursor, row: tuple) -> Dict[str, Any]:
+        keys = self.keys
+        if keys is None:
+            keys = self.keys = tuple(d[0] for d in cursor.description)
+        return dict(zip(keys, row))
+
+
+def dict_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """
+    Create a cursor whose rows are plain dictionaries.
+    
+    Column names are read once per query rather than per row, and callers
+    get dicts without a separate dict(row) pass over the result.
+    
+    Args:
+        conn: Open SQLite connection
+        
+    Returns:
+        Cursor with a dict row factory
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = _DictRowFactory()
+    return cursor
+
+
+def close_connections() -> None:
+    """Close all cached connections opened by the current thread."""
+    connections = getattr(_local, 'connections', None)
+    if not connections:
+        return
+    
+    for conn in connections.values():
+        conn.close()
+    connections.clear()
+
+
 def init_schema(db_path: str, columns: List[str]) -> None:
     """
     Initialize database schema with the given columns.
@@ -34,7 +159,7 @@ def init_schema(db_path: str, columns: List[str]) -> None:
         columns: List of column names from Excel (excluding id, unique_name, timestamps)
     """
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         conn.execute("PRAGMA foreign_keys = ON")
         
         # Create main table
@@ -60,35 +185,96 @@ def init_schema(db_path: str, columns: List[str]) -> None:
         )
         """
         
-        conn.execute(create_table_sql)
+        # FTS5 is required for search; check before touching the schema
+        compile_options = {row[0] for row in conn.execute("PRAGMA compile_options")}
+        if 'ENABLE_FTS5' not in compile_options:
+            raise DatabaseError("SQLite FTS5 support is required but not available")
         
-        # Try to create FTS5 virtual table
+        # Create FTS5 virtual table; search depends on it
         fts_columns = _get_fts_columns(columns)
-        try:
-            fts_sql = f"""
-            CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
-                {', '.join(fts_columns)},
-                content='papers',
-                content_rowid='id'
+        fts_existed = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='papers_fts'"
+        ).fetchone() is not None
+        # Older update triggers issued a plain UPDATE on the FTS table, which
+        # does not remove stale tokens from an external-content index
+        legacy_triggers = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='trigger' AND name='papers_fts_update' "
+            "AND sql LIKE '%UPDATE papers_fts SET%'"
+        ).fetchone() is not None
+        fts_sql = f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+            {', '.join(fts_columns)},
+            content='papers',
+            content_rowid='id'
+        )
+        """
+        
+        # Indexes for common queries; lookup-backed filter columns are indexed
+        # so DISTINCT can walk the B-tree
+        existing_columns = {row[1] for row in conn.execute("PRAGMA table_info(papers)")}
+        table_columns = existing_columns or {
+            *columns, 'unique_name', 'created_at', 'updated_at'
+        }
+        index_sql = [
+            "CREATE INDEX IF NOT EXISTS idx_unique_name ON papers(unique_name)",
+            # read_all orders by updated_at DESC with a LIMIT; these let it
+            # walk an index and stop early instead of sorting every row
+            "CREATE INDEX IF NOT EXISTS idx_updated_at ON papers(updated_at DESC)",
+        ]
+        # Indexes on columns a sheet may not have; a missing column would
+        # make the whole schema script fail
+        optional_index_sql = [
+            (('year',), "CREATE INDEX IF NOT EXISTS idx_year ON papers(year)"),
+            (('journal',), "CREATE INDEX IF NOT EXISTS idx_journal ON papers(journal)"),
+            (('year', 'updated_at'), "CREATE INDEX IF NOT EXISTS idx_year_updated ON papers(year, updated_at DESC)"),
+            (('created_at',), "CREATE INDEX IF NOT EXISTS idx_created_at ON papers(created_at)"),
+            (('title',), "CREATE INDEX IF NOT EXISTS idx_title_nocase ON papers(title COLLATE NOCASE)"),
+        ]
+        for required, sql in optional_index_sql:
+            if all(col in table_columns for col in required):
+                index_sql.append(sql)
+        for col in ('relates_to', 'project_id'):
+            if col in table_columns:
+                index_sql.append(f"CREATE INDEX IF NOT EXISTS idx_{col} ON papers({col})")
+        
+        # Enforce unique names; an existing table that already holds
+        # duplicates keeps working and validate_database reports them
+        duplicates = None
+        if 'unique_name' in existing_columns:
+            duplicates = conn.execute(
+                "SELECT 1 FROM papers WHERE unique_name != '' "
+                "GROUP BY unique_name HAVING COUNT(*) > 1 LIMIT 1"
+            ).fetchone()
+        if duplicates:
+            logger.warning("Duplicate unique_name values found; not enforcing uniqueness")
+        else:
+            index_sql.append(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {_UNIQUE_NAME_INDEX} ON papers(unique_name) "
+                "WHERE unique_name IS NOT NULL AND unique_name <> ''"
             )
-            """
-            conn.execute(fts_sql)
-            
-            # Create triggers to keep FTS in sync
-            _create_fts_triggers(conn, fts_columns)
-            
-            logger.info("FTS5 virtual table created successfully")
-            
-        except sqlite3.OperationalError as e:
-            logger.warning(f"FTS5 not available: {e}. Will use LIKE fallback for search.")
         
-        # Create indexes for common queries
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_year ON papers(year)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_journal ON papers(journal)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_unique_name ON papers(unique_name)")
+        statements = [create_table_sql, fts_sql]
+        statements.extend(_fts_trigger_sql(fts_columns))
+        if not fts_existed or legacy_triggers:
+            # Index rows that were inserted before the FTS table existed, or
+            # that older triggers left out of sync
+            statements.append("INSERT INTO papers_fts(papers_fts) VALUES('rebuild')")
+        statements.extend(index_sql)
         
-        conn.commit()
-        conn.close()
+        # Install the whole schema atomically in one script
+        schema_sql = ";\n".join(statements)
+        try:
+            conn.executescript(f"BEGIN;\n{schema_sql};\nCOMMIT;")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        
+        # Schema may have changed; drop cached columns. The FTS table is
+        # known to exist now, so has_fts_support needs no probe.
+        _cols_cache.pop(db_path, None)
+        _insert_cache.pop(db_path, None)
+        _fts_cache[db_path] = True
         
         logger.info(f"Database schema initialized at {db_path}")
         
@@ -98,146 +284,271 @@ def init_schema(db_path: str, columns: List[str]) -> None:
 
 def _get_fts_columns(columns: List[str]) -> List[str]:
     """Get columns that should be included in FTS index."""
-    fts_candidates = ['title', 'authors', 'journal', 'abstract', 'keywords', 'tags', 'notes']
-    return [col for col in columns if col.lower() in fts_candidates]
+    return [col for col in columns if col.lower() in _FTS_CANDIDATES]
 
 
-def _create_fts_triggers(conn: sqlite3.Connection, fts_columns: List[str]) -> None:
-    """Create triggers to keep FTS table in sync with main table."""
+def _fts_trigger_sql(fts_columns: List[str]) -> List[str]:
+    """
+    Build the triggers that keep the FTS table in sync with the main table.
+    
+    Existing triggers are dropped first so databases created with older
+    trigger definitions are upgraded. The update trigger only fires when an
+    indexed column changes, and uses the external-content 'delete' command
+    to remove the old tokens before indexing the new values.
+    """
+    cols = ', '.join(fts_columns)
+    new_values = ', '.join(f'new.{col}' for col in fts_columns)
+    old_values = ', '.join(f'old.{col}' for col in fts_columns)
     
     # Insert trigger
     insert_sql = f"""
-    CREATE TRIGGER IF NOT EXISTS papers_fts_insert AFTER INSERT ON papers BEGIN
-        INSERT INTO papers_fts(rowid, {', '.join(fts_columns)})
-        VALUES (new.id, {', '.join(f'new.{col}' for col in fts_columns)});
+    CREATE TRIGGER papers_fts_insert AFTER INSERT ON papers BEGIN
+        INSERT INTO papers_fts(rowid, {cols})
+        VALUES (new.id, {new_values});
     END
     """
-    conn.execute(insert_sql)
     
-    # Update trigger
+    # Update trigger, skipped for edits that leave indexed columns alone
     update_sql = f"""
-    CREATE TRIGGER IF NOT EXISTS papers_fts_update AFTER UPDATE ON papers BEGIN
-        UPDATE papers_fts SET {', '.join(f'{col} = new.{col}' for col in fts_columns)}
-        WHERE rowid = new.id;
+    CREATE TRIGGER papers_fts_update AFTER UPDATE OF {cols} ON papers BEGIN
+        INSERT INTO papers_fts(papers_fts, rowid, {cols})
+        VALUES ('delete', old.id, {old_values});
+        INSERT INTO papers_fts(rowid, {cols})
+        VALUES (new.id, {new_values});
     END
     """
-    conn.execute(update_sql)
     
     # Delete trigger
-    delete_sql = """
-    CREATE TRIGGER IF NOT EXISTS papers_fts_delete AFTER DELETE ON papers BEGIN
-        DELETE FROM papers_fts WHERE rowid = old.id;
+    delete_sql = f"""
+    CREATE TRIGGER papers_fts_delete AFTER DELETE ON papers BEGIN
+        INSERT INTO papers_fts(papers_fts, rowid, {cols})
+        VALUES ('delete', old.id, {old_values});
     END
     """
-    conn.execute(delete_sql)
+    
+    return [
+        "DROP TRIGGER IF EXISTS papers_fts_insert",
+        "DROP TRIGGER IF EXISTS papers_fts_update",
+        "DROP TRIGGER IF EXISTS papers_fts_delete",
+        insert_sql,
+        update_sql,
+        delete_sql,
+    ]
 
 
 def list_columns(db_path: str) -> List[str]:
     """
     Get list of columns in the papers table.
     
+    The result is cached per database until the schema is re-initialized.
+    
     Args:
         db_path: Path to SQLite database file
         
     Returns:
         List of column names
     """
+    columns = _cols_cache.get(db_path)
+    if columns is not None:
+        return list(columns)
+    
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         cursor = conn.execute("PRAGMA table_info(papers)")
         columns = [row[1] for row in cursor.fetchall()]
-        conn.close()
-        return columns
+        if columns:
+            _cols_cache[db_path] = columns
+        return list(columns)
     except sqlite3.Error as e:
         raise DatabaseError(f"Failed to list columns: {e}")
 
 
 def has_fts_support(db_path: str) -> bool:
-    """Check if database has FTS5 support enabled."""
+    """
+    Check if database has FTS5 support enabled.
+    
+    The flag is recorded by init_schema; databases that were not initialized
+    in this process are probed once and the result cached.
+    """
+    result = _fts_cache.get(db_path)
+    if result is not None:
+        return result
+    
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='papers_fts'")
         result = cursor.fetchone() is not None
-        conn.close()
-        return result
     except sqlite3.Error:
         return False
+    
+    _fts_cache[db_path] = result
+    return result
 
 
-def read_all(db_path: str, search: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, limit: int = 1000) -> List[Dict[str, Any]]:
+def _sanitize_fts_query(search: str) -> Optional[str]:
     """
-    Read records from database with optional search and filters.
+    Turn free-form user input into a safe FTS5 MATCH expression.
+    
+    Each token is quoted (so characters like '-', ':' or '"' are not parsed
+    as FTS5 syntax) and prefix-matched; tokens are implicitly AND-ed.
+    
+    Args:
+        search: Raw search text
+        
+    Returns:
+        MATCH expression, or None if the input has nothing searchable
+    """
+    tokens = []
+    for token in search.split():
+        token = token.replace('"', '')
+        # Bare operators such as '-' contain no indexable characters
+        if any(ch.isalnum() for ch in token):
+            tokens.append(f'"{token}"*')
+    return ' '.join(tokens) or None
+
+
+def _build_read_query(db_path: str, search: Optional[str], filters: Optional[Dict[str, Any]], limit: int, order_by: Optional[str] = None) -> Tuple[str, List[Any]]:
+    """
+    Build the SELECT used by read_all.
     
     Args:
         db_path: Path to SQLite database file
-        search: Search term for FTS or LIKE search
-        filters: Dictionary of column filters (e.g., {'year': 2023, 'journal': 'Nature'})
-        limit: Maximum number of records to return
+        search: Free-text search term (matched against the FTS5 index)
+        filters: Dictionary of column filters
+        limit: Maximum number of records (negative for no limit)
+        order_by: Key of _SORT_ORDERS, or None for relevance/recency
         
     Returns:
-        List of record dictionaries
+        Tuple of (query, parameters)
+        
+    Raises:
+        ValueError: If a filter key or order_by is not recognized
+        DatabaseError: If searching and the FTS index is missing
     """
-    try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        
-        # Build query
-        if search and has_fts_support(db_path):
-            # Use FTS5 search
-            query = """
-            SELECT papers.* FROM papers
-            JOIN papers_fts ON papers.id = papers_fts.rowid
-            WHERE papers_fts MATCH ?
-            """
-            params = [search]
-        elif search:
-            # Fallback to LIKE search
-            search_columns = ['title', 'authors', 'journal', 'abstract', 'keywords', 'tags', 'notes', 'doi', 'url']
-            like_conditions = []
-            params = []
-            
-            for col in search_columns:
-                like_conditions.append(f"{col} LIKE ?")
-                params.append(f"%{search}%")
-            
-            query = f"SELECT * FROM papers WHERE ({' OR '.join(like_conditions)})"
+    if order_by is not None and order_by not in _SORT_ORDERS:
+        raise ValueError(f"Unknown sort order: {order_by}")
+    
+    # Filter keys become SQL identifiers; only allow real columns
+    if filters:
+        valid_columns = set(list_columns(db_path))
+        for key in filters:
+            if key not in valid_columns:
+                raise ValueError(f"Unknown filter column: {key}")
+    
+    # Build filter conditions
+    filter_conditions = []
+    filter_params = []
+    if filters:
+        for key, value in filters.items():
+            if value:  # Skip empty filters
+                if isinstance(value, str):
+                    filter_conditions.append(f"papers.{key} LIKE ?")
+                    filter_params.append(f"%{value}%")
+                else:
+                    filter_conditions.append(f"papers.{key} = ?")
+                    filter_params.append(value)
+    
+    match = _sanitize_fts_query(search) if search else None
+    if match and not has_fts_support(db_path):
+        raise DatabaseError("Full-text index (papers_fts) is missing; re-run init_schema")
+    
+    # Build query
+    if match:
+        # Rank matches inside the FTS index first and only then join and
+        # filter; AND-ing MATCH with column filters in a single WHERE lets
+        # the planner abandon the FTS index. Overfetch when filters may
+        # discard some of the ranked matches.
+        fts_limit = limit * 10 if filter_conditions and limit >= 0 else limit
+        query = """
+        WITH fts_matches AS (
+            SELECT rowid, bm25(papers_fts) AS score FROM papers_fts
+            WHERE papers_fts MATCH ? ORDER BY score LIMIT ?
+        )
+        SELECT papers.* FROM fts_matches fm
+        JOIN papers ON papers.id = fm.rowid
+        """
+        params = [match, fts_limit]
+        if filter_conditions:
+            query += " WHERE " + " AND ".join(filter_conditions)
+        params.extend(filter_params)
+        if order_by:
+            query += f" ORDER BY {_SORT_ORDERS[order_by]}, papers.updated_at DESC LIMIT ?"
         else:
-            query = "SELECT * FROM papers"
-            params = []
-        
-        # Add filters
-        if filters:
-            filter_conditions = []
-            for key, value in filters.items():
-                if value:  # Skip empty filters
-                    if isinstance(value, str):
-                        filter_conditions.append(f"{key} LIKE ?")
-                        params.append(f"%{value}%")
-                    else:
-                        filter_conditions.append(f"{key} = ?")
-                        params.append(value)
-            
-            if filter_conditions:
-                connector = " AND " if search else " WHERE "
-                query += connector + " AND ".join(filter_conditions)
+            query += " ORDER BY fm.score, papers.updated_at DESC LIMIT ?"
+        params.append(limit)
+    else:
+        query = "SELECT * FROM papers"
+        params = list(filter_params)
+        if filter_conditions:
+            query += " WHERE " + " AND ".join(filter_conditions)
         
         # Add ordering and limit
-        query += " ORDER BY updated_at DESC LIMIT ?"
+        if order_by:
+            query += f" ORDER BY {_SORT_ORDERS[order_by]}, papers.updated_at DESC LIMIT ?"
+        else:
+            query += " ORDER BY updated_at DESC LIMIT ?"
         params.append(limit)
+    
+    return query, params
+
+
+def read_all(db_path: str, search: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, limit: int = 1000, order_by: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Read records from database with optional search and filters.
+    
+    Args:
+        db_path: Path to SQLite database file
+        search: Free-text search term (matched against the FTS5 index)
+        filters: Dictionary of column filters (e.g., {'year': 2023, 'journal': 'Nature'})
+        limit: Maximum number of records to return
+        order_by: Sort order ('id', 'created_desc', 'created_asc', 'title_asc',
+            'title_desc', 'year_desc', 'year_asc'); default is search
+            relevance, then most recently updated
         
-        cursor = conn.execute(query, params)
-        rows = cursor.fetchall()
-        
-        # Convert to dictionaries
-        result = [dict(row) for row in rows]
+    Returns:
+        List of record dictionaries
         
-        conn.close()
-        return result
+    Raises:
+        ValueError: If a filter key or sort order is not recognized
+    """
+    query, params = _build_read_query(db_path, search, filters, limit, order_by)
+    
+    try:
+        conn = get_connection(db_path)
+        cursor = dict_cursor(conn).execute(query, params)
+        return cursor.fetchall()
         
     except sqlite3.Error as e:
         raise DatabaseError(f"Failed to read records: {e}")
 
 
+def _insert_statement(db_path: str) -> Tuple[Tuple[str, ...], str]:
+    """
+    Get the cached INSERT statement for a database.
+    
+    The statement always lists every user column (NULL for missing values)
+    so its SQL text is constant and hits the connection's statement cache;
+    SQLite fills in the timestamps.
+    
+    Args:
+        db_path: Path to SQLite database file
+        
+    Returns:
+        Tuple of (bound column names, INSERT SQL)
+    """
+    cached = _insert_cache.get(db_path)
+    if cached is not None:
+        return cached
+    
+    columns = tuple(col for col in list_columns(db_path) if col not in _SYSTEM_COLUMNS)
+    placeholders = ', '.join(['?'] * len(columns) + ["datetime('now')"] * 2)
+    column_names = ', '.join(columns + ('created_at', 'updated_at'))
+    cached = (columns, f"INSERT INTO papers ({column_names}) VALUES ({placeholders})")
+    if columns:
+        _insert_cache[db_path] = cached
+    return cached
+
+
 def create_record(db_path: str, data: Dict[str, Any]) -> int:
     """
     Create a new record in the database.
@@ -252,31 +563,15 @@ def create_record(db_path: str, data: Dict[str, Any]) -> int:
     try:
         # Generate unique_name (skip for now, will be handled separately)
         # data['unique_name'] = unique_name_from_row(data)
-        data['created_at'] = datetime.now().isoformat()
-        data['updated_at'] = datetime.now().isoformat()
+        conn = get_connection(db_path)
         
-        conn = sqlite3.connect(db_path)
+        columns, query = _insert_statement(db_path)
+        values = tuple(data.get(col) for col in columns)
         
-        # Get column names (excluding id which is auto-increment)
-        columns = list_columns(db_path)
-        columns = [col for col in columns if col != 'id']
-        
-        # Filter data to only include existing columns
-        filtered_data = {k: v for k, v in data.items() if k in columns}
-        
-        # Build insert query
-        placeholders = ', '.join(['?' for _ in filtered_data])
-        column_names = ', '.join(filtered_data.keys())
-        
-        query = f"INSERT INTO papers ({column_names}) VALUES ({placeholders})"
-        values = list(filtered_data.values())
-        
-        cursor = conn.execute(query, values)
+        with conn:
+            cursor = conn.execute(query, values)
         record_id = cursor.lastrowid
         
-        conn.commit()
-        conn.close()
-        
         logger.info(f"Created record with ID {record_id}")
         return record_id
         
@@ -284,6 +579,42 @@ def create_record(db_path: str, data: Dict[str, Any]) -> int:
         raise DatabaseError(f"Failed to create record: {e}")
 
 
+def create_records(db_path: str, rows: List[Dict[str, Any]], auto_commit: bool = True) -> int:
+    """
+    Create many records in a single transaction.
+    
+    Args:
+        db_path: Path to SQLite database file
+        rows: List of dictionaries of column values
+        auto_commit: Commit when done; if False the transaction is left open
+            and the caller commits on get_connection(db_path)
+        
+    Returns:
+        Number of records inserted
+    """
+    if not rows:
+        return 0
+    
+    conn = get_connection(db_path)
+    try:
+        columns, query = _insert_statement(db_path)
+        values = [tuple(row.get(col) for col in columns) for row in rows]
+        
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(query, values)
+        if auto_commit:
+            conn.commit()
+        
+        logger.info(f"Created {len(values)} records")
+        return len(values)
+        
+    except sqlite3.Error as e:
+        if conn.in_transaction:
+            conn.rollback()
+        raise DatabaseError(f"Failed to create records: {e}")
+
+
 def update_record(db_path: str, rec_id: int, data: Dict[str, Any]) -> None:
     """
     Update an existing record in the database.
@@ -296,36 +627,88 @@ def update_record(db_path: str, rec_id: int, data: Dict[str, Any]) -> None:
     try:
         # Generate unique_name (skip for now, will be handled separately)
         # data['unique_name'] = unique_name_from_row(data)
-        data['updated_at'] = datetime.now().isoformat()
+        conn = get_connection(db_path)
         
-        conn = sqlite3.connect(db_path)
-        
-        # Get column names (excluding id)
+        # Get column names (excluding id and the timestamps SQLite fills in)
         columns = list_columns(db_path)
-        columns = [col for col in columns if col != 'id']
+        columns = [col for col in columns if col not in _SYSTEM_COLUMNS]
         
-        # Filter data to only include existing columns
-        filtered_data = {k: v for k, v in data.items() if k in columns}
+        # Only update columns present in data, in table order, so the same
+        # set of keys always produces the same (cached) statement
+        update_columns = [col for col in columns if col in data]
         
         # Build update query
-        set_clauses = [f"{col} = ?" for col in filtered_data.keys()]
+        set_clauses = [f"{col} = ?" for col in update_columns]
+        set_clauses.append("updated_at = datetime('now')")
         query = f"UPDATE papers SET {', '.join(set_clauses)} WHERE id = ?"
-        values = list(filtered_data.values()) + [rec_id]
+        values = [data[col] for col in update_columns] + [rec_id]
         
-        cursor = conn.execute(query, values)
+        with conn:
+            cursor = conn.execute(query, values)
         
         if cursor.rowcount == 0:
             raise DatabaseError(f"No record found with ID {rec_id}")
         
-        conn.commit()
-        conn.close()
-        
         logger.info(f"Updated record with ID {rec_id}")
         
     except sqlite3.Error as e:
         raise DatabaseError(f"Failed to update record: {e}")
 
 
+def update_read_status(db_path: str, rec_id: int, read: bool) -> None:
+    """
+    Set a record's read flag.
+    
+    Uses one fixed statement, so repeated toggles reuse the connection's
+    prepared statement instead of rebuilding an UPDATE per call.
+    
+    Args:
+        db_path: Path to SQLite database file
+        rec_id: ID of record to update
+        read: Whether the paper has been read
+    """
+    try:
+        conn = get_connection(db_path)
+        
+        with conn:
+            cursor = conn.execute(
+                "UPDATE papers SET read = ?, updated_at = datetime('now') WHERE id = ?",
+                ('Yes' if read else 'No', rec_id)
+            )
+        
+        if cursor.rowcount == 0:
+            raise DatabaseError(f"No record found with ID {rec_id}")
+        
+    except sqlite3.Error as e:
+        raise DatabaseError(f"Failed to update read status: {e}")
+
+
+def set_record_pdf(db_path: str, rec_id: int, unique_name: str, pdf: str) -> None:
+    """
+    Link a record to its stored PDF.
+    
+    Args:
+        db_path: Path to SQLite database file
+        rec_id: ID of record to update
+        unique_name: Unique name generated for the record
+        pdf: PDF file name, relative to the PDF folder
+    """
+    try:
+        conn = get_connection(db_path)
+        
+        with conn:
+            cursor = conn.execute(
+                "UPDATE papers SET unique_name = ?, pdf = ?, updated_at = datetime('now') WHERE id = ?",
+                (unique_name, pdf, rec_id)
+            )
+        
+        if cursor.rowcount == 0:
+            raise DatabaseError(f"No record found with ID {rec_id}")
+        
+    except sqlite3.Error as e:
+        raise DatabaseError(f"Failed to link PDF: {e}")
+
+
 def delete_record(db_path: str, rec_id: int) -> None:
     """
     Delete a record from the database.
@@ -335,22 +718,66 @@ def delete_record(db_path: str, rec_id: int) -> None:
         rec_id: ID of record to delete
     """
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         
-        cursor = conn.execute("DELETE FROM papers WHERE id = ?", (rec_id,))
+        with conn:
+            cursor = conn.execute("DELETE FROM papers WHERE id = ?", (rec_id,))
         
         if cursor.rowcount == 0:
             raise DatabaseError(f"No record found with ID {rec_id}")
         
-        conn.commit()
-        conn.close()
-        
         logger.info(f"Deleted record with ID {rec_id}")
         
     except sqlite3.Error as e:
         raise DatabaseError(f"Failed to delete record: {e}")
 
 
+def delete_records(db_path: str, rec_ids: List[int]) -> Tuple[int, List[str]]:
+    """
+    Delete many records in a single transaction.
+    
+    Ids that no longer exist are skipped. The PDF file names are returned
+    rather than removed, so files are only touched once the rows are gone.
+    
+    Args:
+        db_path: Path to SQLite database file
+        rec_ids: IDs of records to delete
+        
+    Returns:
+        Tuple of (number of records deleted, their non-empty pdf values)
+    """
+    if not rec_ids:
+        return 0, []
+    
+    has_pdf = 'pdf' in list_columns(db_path)
+    conn = get_connection(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        
+        pdfs = []
+        if has_pdf:
+            for start in range(0, len(rec_ids), _ID_BATCH_SIZE):
+                batch = rec_ids[start:start + _ID_BATCH_SIZE]
+                placeholders = ', '.join('?' * len(batch))
+                cursor = conn.execute(
+                    f"SELECT pdf FROM papers WHERE id IN ({placeholders}) AND pdf IS NOT NULL AND pdf != ''",
+                    batch
+                )
+                pdfs.extend(row[0] for row in cursor)
+        
+        cursor = conn.executemany("DELETE FROM papers WHERE id = ?", [(rec_id,) for rec_id in rec_ids])
+        deleted = cursor.rowcount
+        conn.commit()
+        
+        logger.info(f"Deleted {deleted} records")
+        return deleted, pdfs
+        
+    except sqlite3.Error as e:
+        if conn.in_transaction:
+            conn.rollback()
+        raise DatabaseError(f"Failed to delete records: {e}")
+
+
 def get_record(db_path: str, rec_id: int) -> Optional[Dict[str, Any]]:
     """
     Get a single record by ID.
@@ -363,15 +790,10 @@ def get_record(db_path: str, rec_id: int) -> Optional[Dict[str, Any]]:
         Record dictionary or None if not found
     """
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_connection(db_path)
         
-        cursor = conn.execute("SELECT * FROM papers WHERE id = ?", (rec_id,))
-        row = cursor.fetchone()
-        
-        conn.close()
-        
-        return dict(row) if row else None
+        cursor = dict_cursor(conn).execute("SELECT * FROM papers WHERE id = ?", (rec_id,))
+        return cursor.fetchone()
         
     except sqlite3.Error as e:
         raise DatabaseError(f"Failed to get record: {e}")
@@ -386,27 +808,28 @@ def export_csv(db_path: str, out_path: str) -> None:
         out_path: Path to output CSV file
     """
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_connection(db_path)
         
+        # Stream rows in batches instead of materializing the table
         cursor = conn.execute("SELECT * FROM papers ORDER BY id")
-        rows = cursor.fetchall()
+        cursor.arraysize = _EXPORT_BATCH_SIZE
+        batch = cursor.fetchmany()
         
-        if not rows:
+        if not batch:
             raise DatabaseError("No records to export")
         
         # Write CSV
-        with open(out_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = rows[0].keys()
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        with open(out_path, 'w', newline='', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
             
-            writer.writeheader()
-            for row in rows:
-                writer.writerow(dict(row))
+            writer.writerow([d[0] for d in cursor.description])
+            count = 0
+            while batch:
+                writer.writerows(batch)
+                count += len(batch)
+                batch = cursor.fetchmany()
         
-        conn.close()
-        
-        logger.info(f"Exported {len(rows)} records to {out_path}")
+        logger.info(f"Exported {count} records to {out_path}")
         
     except (sqlite3.Error, IOError) as e:
         raise DatabaseError(f"Failed to export CSV: {e}")
@@ -422,15 +845,19 @@ def get_unique_values(db_path: str, column: str) -> List[str]:
         
     Returns:
         List of unique values
+        
+    Raises:
+        ValueError: If column is not a column of the papers table
     """
+    # Identifiers cannot be bound as parameters; only allow real columns
+    if column not in list_columns(db_path):
+        raise ValueError(f"Unknown column: {column}")
+    
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         
         cursor = conn.execute(f"SELECT DISTINCT {column} FROM papers WHERE {column} IS NOT NULL AND {column} != '' ORDER BY {column}")
-        values = [row[0] for row in cursor.fetchall()]
-        
-        conn.close()
-        return values
+        return [row[0] for row in cursor.fetchall()]
         
     except sqlite3.Error as e:
         raise DatabaseError(f"Failed to get unique values: {e}")
@@ -447,21 +874,19 @@ def get_stats(db_path: str) -> Dict[str, Any]:
         Dictionary with statistics
     """
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         
-        # Total records
-        cursor = conn.execute("SELECT COUNT(*) FROM papers")
-        total_records = cursor.fetchone()[0]
+        # Total records and recent additions in a single pass
+        cursor = conn.execute("""
+            SELECT COUNT(*),
+                   COALESCE(SUM(CASE WHEN date(created_at) >= date('now', '-7 days') THEN 1 ELSE 0 END), 0)
+            FROM papers
+        """)
+        total_records, recent_additions = cursor.fetchone()
         
         # Records by year
         cursor = conn.execute("SELECT year, COUNT(*) FROM papers WHERE year IS NOT NULL GROUP BY year ORDER BY year DESC LIMIT 10")
-        by_year = dict(cursor.fetchall())
-        
-        # Recent additions
-        cursor = conn.execute("SELECT COUNT(*) FROM papers WHERE date(created_at) >= date('now', '-7 days')")
-        recent_additions = cursor.fetchone()[0]
-        
-        conn.close()
+        by_year = {year: count for year, count in cursor.fetchall()}
         
         return {
             'total_records': total_records,
@@ -488,7 +913,7 @@ def validate_database(db_path: str) -> List[str]:
     issues = []
     
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         
         # Check if main table exists
         cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='papers'")
@@ -502,13 +927,16 @@ def validate_database(db_path: str) -> List[str]:
         if missing_unique > 0:
             issues.append(f"{missing_unique} records have missing unique_name")
         
-        # Check for duplicate unique_names
-        cursor = conn.execute("SELECT unique_name, COUNT(*) FROM papers WHERE unique_name != '' GROUP BY unique_name HAVING COUNT(*) > 1")
-        duplicates = cursor.fetchall()
-        if duplicates:
-            issues.append(f"{len(duplicates)} duplicate unique_name values found")
-        
-        conn.close()
+        # Check for duplicate unique_names; the unique index makes them
+        # impossible, so only scan databases created without it
+        cursor = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='index' AND name=?", (_UNIQUE_NAME_INDEX,)
+        )
+        if cursor.fetchone() is None:
+            cursor = conn.execute("SELECT unique_name, COUNT(*) FROM papers WHERE unique_name != '' GROUP BY unique_name HAVING COUNT(*) > 1")
+            duplicates = cursor.fetchall()
+            if duplicates:
+                issues.append(f"{len(duplicates)} duplicate unique_name values found")
         
     except sqlite3.Error as e:
         issues.append(f"Database error: {e}")
@@ -542,4 +970,5 @@ if __name__ == "__main__":
     print(f"Found {len(records)} records")
     
     # Clean up
+    close_connections()
     os.remove(test_db)
@@ -6,12 +6,52 @@ allowing users to maintain the categories and projects that papers can belong to
 """
 
 import sqlite3
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Union
 import logging
 
+from .db import get_connection, dict_cursor
+
 logger = logging.getLogger(__name__)
 
 
+class LookupsSession:
+    """
+    Context manager for several lookup reads on one connection.
+    
+    Yields the current thread's cached connection and holds a read
+    transaction, so all reads inside the block see the same snapshot.
+    
+    Example:
+        with LookupsSession(db_path) as conn:
+            relates = get_relates_to_options(conn)
+            projects = get_project_id_options(conn)
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.conn = None
+        self.started = False
+    
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn = get_connection(self.db_path)
+        self.started = not self.conn.in_transaction
+        if self.started:
+            self.conn.execute("BEGIN")
+        return self.conn
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self.started and self.conn.in_transaction:
+            self.conn.commit()
+        return False
+
+
+def _resolve_connection(db: Union[str, sqlite3.Connection]) -> sqlite3.Connection:
+    """Accept either a database path or an open connection."""
+    if isinstance(db, sqlite3.Connection):
+        return db
+    return get_connection(db)
+
+
 def init_lookup_tables(db_path: str) -> None:
     """
     Initialize lookup tables for relates_to and project_id.
@@ -20,39 +60,37 @@ def init_lookup_tables(db_path: str) -> None:
         db_path: Path to SQLite database file
     """
     try:
-        conn = sqlite3.connect(db_path)
-        
-        # Create relates_to lookup table
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS relates_to_lookup (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                description TEXT,
-                created_at TEXT DEFAULT (datetime('now'))
-            )
-        """)
+        conn = get_connection(db_path)
         
-        # Create project_id lookup table
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS project_id_lookup (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                description TEXT,
-                created_at TEXT DEFAULT (datetime('now'))
-            )
-        """)
-        
-        # Populate with existing values from papers table if empty
-        cursor = conn.execute("SELECT COUNT(*) FROM relates_to_lookup")
-        if cursor.fetchone()[0] == 0:
-            _populate_relates_to_defaults(conn)
-        
-        cursor = conn.execute("SELECT COUNT(*) FROM project_id_lookup")
-        if cursor.fetchone()[0] == 0:
-            _populate_project_id_defaults(conn)
-        
-        conn.commit()
-        conn.close()
+        with conn:
+            # Create relates_to lookup table
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS relates_to_lookup (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    description TEXT,
+                    created_at TEXT DEFAULT (datetime('now'))
+                )
+            """)
+            
+            # Create project_id lookup table
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS project_id_lookup (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    description TEXT,
+                    created_at TEXT DEFAULT (datetime('now'))
+                )
+            """)
+            
+            # Populate defaults if empty (same transaction as the creates)
+            cursor = conn.execute("SELECT COUNT(*) FROM relates_to_lookup")
+            if cursor.fetchone()[0] == 0:
+                _populate_relates_to_defaults(conn)
+            
+            cursor = conn.execute("SELECT COUNT(*) FROM project_id_lookup")
+            if cursor.fetchone()[0] == 0:
+                _populate_project_id_defaults(conn)
         
         logger.info("Lookup tables initialized successfully")
         
@@ -69,11 +107,10 @@ def _populate_relates_to_defaults(conn: sqlite3.Connection) -> None:
         ('OTER', 'Other', 'Other types of research')
     ]
     
-    for code, name, desc in defaults:
-        conn.execute(
-            "INSERT OR IGNORE INTO relates_to_lookup (id, name, description) VALUES (?, ?, ?)",
-            (code, name, desc)
-        )
+    conn.executemany(
+        "INSERT OR IGNORE INTO relates_to_lookup (id, name, description) VALUES (?, ?, ?)",
+        defaults
+    )
 
 
 def _populate_project_id_defaults(conn: sqlite3.Connection) -> None:
@@ -91,63 +128,73 @@ def _populate_project_id_defaults(conn: sqlite3.Connection) -> None:
         ('JOLN', 'Journal Club - MERLN', 'Journal Club Meetings @ MERLN')
     ]
     
-    for code, name, desc in defaults:
-        conn.execute(
-            "INSERT OR IGNORE INTO project_id_lookup (id, name, description) VALUES (?, ?, ?)",
-            (code, name, desc)
-        )
+    conn.executemany(
+        "INSERT OR IGNORE INTO project_id_lookup (id, name, description) VALUES (?, ?, ?)",
+        defaults
+    )
 
 
-def get_relates_to_options(db_path: str) -> List[Dict[str, str]]:
+def get_relates_to_options(db: Union[str, sqlite3.Connection]) -> List[Dict[str, str]]:
     """
     Get all relates_to options.
     
     Args:
-        db_path: Path to SQLite database file
+        db: Path to SQLite database file, or a connection from LookupsSession
         
     Returns:
         List of dictionaries with id, name, description
     """
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = _resolve_connection(db)
         
-        cursor = conn.execute("SELECT id, name, description FROM relates_to_lookup ORDER BY name")
-        result = [dict(row) for row in cursor.fetchall()]
-        
-        conn.close()
-        return result
+        cursor = dict_cursor(conn).execute("SELECT id, name, description FROM relates_to_lookup ORDER BY name")
+        return cursor.fetchall()
         
     except sqlite3.Error as e:
         logger.error(f"Failed to get relates_to options: {e}")
         return []
 
 
-def get_project_id_options(db_path: str) -> List[Dict[str, str]]:
+def get_project_id_options(db: Union[str, sqlite3.Connection]) -> List[Dict[str, str]]:
     """
     Get all project_id options.
     
     Args:
-        db_path: Path to SQLite database file
+        db: Path to SQLite database file, or a connection from LookupsSession
         
     Returns:
         List of dictionaries with id, name, description
     """
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        
-        cursor = conn.execute("SELECT id, name, description FROM project_id_lookup ORDER BY name")
-        result = [dict(row) for row in cursor.fetchall()]
+        conn = _resolve_connection(db)
         
-        conn.close()
-        return result
+        cursor = dict_cursor(conn).execute("SELECT id, name, description FROM project_id_lookup ORDER BY name")
+        return cursor.fetchall()
         
     except sqlite3.Error as e:
         logger.error(f"Failed to get project_id options: {e}")
         return []
 
 
+def get_lookup_bundle(db_path: str) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+    """
+    Get relates_to and project_id options in one read transaction.
+    
+    Args:
+        db_path: Path to SQLite database file
+        
+    Returns:
+        Tuple of (relates_to options, project_id options)
+    """
+    try:
+        with LookupsSession(db_path) as conn:
+            return get_relates_to_options(conn), get_project_id_options(conn)
+        
+    except sqlite3.Error as e:
+        logger.error(f"Failed to get lookup options: {e}")
+        return [], []
+
+
 def add_relates_to_option(db_path: str, code: str, name: str, description: str = "") -> bool:
     """
     Add a new relates_to option.
@@ -162,13 +209,12 @@ def add_relates_to_option(db_path: str, code: str, name: str, description: str =
         True if successful, False otherwise
     """
     try:
-        conn = sqlite3.connect(db_path)
-        conn.execute(
-            "INSERT INTO relates_to_lookup (id, name, description) VALUES (?, ?, ?)",
-            (code.upper(), name, description)
-        )
-        conn.commit()
-        conn.close()
+        conn = get_connection(db_path)
+        with conn:
+            conn.execute(
+                "INSERT INTO relates_to_lookup (id, name, description) VALUES (?, ?, ?)",
+                (code.upper(), name, description)
+            )
         return True
         
     except sqlite3.Error as e:
@@ -190,13 +236,12 @@ def add_project_id_option(db_path: str, code: str, name: str, description: str =
         True if successful, False otherwise
     """
     try:
-        conn = sqlite3.connect(db_path)
-        conn.execute(
-            "INSERT INTO project_id_lookup (id, name, description) VALUES (?, ?, ?)",
-            (code.upper(), name, description)
-        )
-        conn.commit()
-        conn.close()
+        conn = get_connection(db_path)
+        with conn:
+            conn.execute(
+                "INSERT INTO project_id_lookup (id, name, description) VALUES (?, ?, ?)",
+                (code.upper(), name, description)
+            )
         return True
         
     except sqlite3.Error as e:
@@ -207,16 +252,14 @@ def add_project_id_option(db_path: str, code: str, name: str, description: str =
 def update_relates_to_option(db_path: str, code: str, name: str, description: str = "") -> bool:
     """Update an existing relates_to option."""
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.execute(
-            "UPDATE relates_to_lookup SET name = ?, description = ? WHERE id = ?",
-            (name, description, code.upper())
-        )
+        conn = get_connection(db_path)
+        with conn:
+            cursor = conn.execute(
+                "UPDATE relates_to_lookup SET name = ?, description = ? WHERE id = ?",
+                (name, description, code.upper())
+            )
         
-        success = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
-        return success
+        return cursor.rowcount > 0
         
     except sqlite3.Error as e:
         logger.error(f"Failed to update relates_to option: {e}")
@@ -226,16 +269,14 @@ def update_relates_to_option(db_path: str, code: str, name: str, description: st
 def update_project_id_option(db_path: str, code: str, name: str, description: str = "") -> bool:
     """Update an existing project_id option."""
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.execute(
-            "UPDATE project_id_lookup SET name = ?, description = ? WHERE id = ?",
-            (name, description, code.upper())
-        )
+        conn = get_connection(db_path)
+        with conn:
+            cursor = conn.execute(
+                "UPDATE project_id_lookup SET name = ?, description = ? WHERE id = ?",
+                (name, description, code.upper())
+            )
         
-        success = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
-        return success
+        return cursor.rowcount > 0
         
     except sqlite3.Error as e:
         logger.error(f"Failed to update project_id option: {e}")
@@ -245,21 +286,18 @@ def update_project_id_option(db_path: str, code: str, name: str, description: st
 def delete_relates_to_option(db_path: str, code: str) -> bool:
     """Delete a relates_to option (only if not used in papers)."""
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         
         # Check if used in papers
         cursor = conn.execute("SELECT COUNT(*) FROM papers WHERE relates_to = ?", (code.upper(),))
         if cursor.fetchone()[0] > 0:
-            conn.close()
             return False  # Cannot delete if used
         
         # Delete from lookup
-        cursor = conn.execute("DELETE FROM relates_to_lookup WHERE id = ?", (code.upper(),))
-        success = cursor.rowcount > 0
+        with conn:
+            cursor = conn.execute("DELETE FROM relates_to_lookup WHERE id = ?", (code.upper(),))
         
-        conn.commit()
-        conn.close()
-        return success
+        return cursor.rowcount > 0
         
     except sqlite3.Error as e:
         logger.error(f"Failed to delete relates_to option: {e}")
@@ -269,21 +307,18 @@ def delete_relates_to_option(db_path: str, code: str) -> bool:
 def delete_project_id_option(db_path: str, code: str) -> bool:
     """Delete a project_id option (only if not used in papers)."""
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         
         # Check if used in papers
         cursor = conn.execute("SELECT COUNT(*) FROM papers WHERE project_id = ?", (code.upper(),))
         if cursor.fetchone()[0] > 0:
-            conn.close()
             return False  # Cannot delete if used
         
         # Delete from lookup
-        cursor = conn.execute("DELETE FROM project_id_lookup WHERE id = ?", (code.upper(),))
-        success = cursor.rowcount > 0
+        with conn:
+            cursor = conn.execute("DELETE FROM project_id_lookup WHERE id = ?", (code.upper(),))
         
-        conn.commit()
-        conn.close()
-        return success
+        return cursor.rowcount > 0
         
     except sqlite3.Error as e:
         logger.error(f"Failed to delete project_id option: {e}")
@@ -13,31 +13,39 @@ This module implements the main UI with:
 
 import sys
 import os
+import errno
 import platform
+import re
+import shutil
 import subprocess
+import threading
+import time
 import traceback
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 import logging
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QTableWidget, QTableWidgetItem, QPushButton, QLineEdit, QLabel,
+    QTableView, QPushButton, QLineEdit, QLabel,
     QToolBar, QStatusBar, QMessageBox, QDialog, QDialogButtonBox,
     QFormLayout, QTextEdit, QSpinBox, QFileDialog, QProgressDialog,
     QHeaderView, QAbstractItemView, QComboBox, QGroupBox, QCheckBox,
-    QSplitter, QTabWidget, QPlainTextEdit, QListWidget, QProgressBar
+    QSplitter, QTabWidget, QPlainTextEdit, QListWidget, QProgressBar, QCompleter
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QAction, QKeySequence, QIcon
+from PyQt6.QtCore import (
+    Qt, QThread, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex
+)
+from PyQt6.QtGui import QAction, QKeySequence, QIcon, QStandardItemModel, QStandardItem
 
 from .settings import get_settings, configure_logging_from_settings
 from .db import (
-    init_schema, read_all, create_record, update_record, delete_record,
-    get_record, export_csv, list_columns, get_unique_values, get_stats,
-    validate_database, DatabaseError
+    init_schema, read_all, create_record, update_record, update_read_status, delete_records,
+    set_record_pdf, get_record, export_csv, list_columns, get_unique_values, get_stats,
+    validate_database, close_connections, DatabaseError
 )
 from .lookups import (
-    init_lookup_tables, get_relates_to_options, get_project_id_options,
+    init_lookup_tables, get_lookup_bundle, get_relates_to_options, get_project_id_options,
     add_relates_to_option, add_project_id_option, update_relates_to_option,
     update_project_id_option, delete_relates_to_option, delete_project_id_option
 )
@@ -46,6 +54,228 @@ from .lookups import (
 configure_logging_from_settings()
 logger = logging.getLogger(__name__)
 
+# The Excel migration (and pandas) is imported once, preloaded on a
+# background thread at startup so neither the first window nor an import
+# waits for it; the app still runs if its dependencies are missing
+_project_root = os.path.join(os.path.dirname(__file__), '..')
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+_build_db = None
+_build_db_error = None
+_build_db_lock = threading.Lock()
+
+
+def _load_build_db():
+    """
+    Import build_db from the Excel migration script, once.
+    
+    Returns:
+        build_db, or None if its dependencies are unavailable
+    """
+    global _build_db, _build_db_error
+    with _build_db_lock:
+        if _build_db is None and _build_db_error is None:
+            try:
+                from scripts.migrate_from_excel import build_db
+                _build_db = build_db
+            except ImportError as e:
+                _build_db_error = e
+                logger.warning(f"Excel import unavailable: {e}")
+    return _build_db
+
+# Resolve the platform's "open with default application" once at import
+_PLATFORM = platform.system()
+if _PLATFORM == "Windows":
+    _open_with_system = os.startfile
+elif _PLATFORM == "Darwin":  # macOS
+    def _open_with_system(target: str) -> None:
+        subprocess.run(["open", target])
+else:  # Linux and others
+    def _open_with_system(target: str) -> None:
+        subprocess.run(["xdg-open", target])
+
+# Existence checks of the database file and PDFs are reused for this many
+# seconds; menu actions and repeated opens otherwise stat them on every use
+_PATH_EXISTS_TTL = 1.0
+_path_exists_cache: Dict[str, Tuple[bool, float]] = {}
+
+
+def _path_exists(path: str) -> bool:
+    """os.path.exists, cached for _PATH_EXISTS_TTL seconds per path."""
+    now = time.monotonic()
+    cached = _path_exists_cache.get(path)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+    
+    exists = os.path.exists(path)
+    _path_exists_cache[path] = (exists, now + _PATH_EXISTS_TTL)
+    return exists
+
+
+def _forget_path(path: Optional[str] = None) -> None:
+    """Drop cached existence checks for one path, or for all paths."""
+    if path is None:
+        _path_exists_cache.clear()
+    else:
+        _path_exists_cache.pop(path, None)
+
+
+# Buffer size for user-space PDF copies, used when the kernel cannot copy
+PDF_COPY_BUFSIZE = 1 << 20
+
+# Kernel copy errors that mean "not possible here", not a failed copy
+_KERNEL_COPY_FALLBACK_ERRNOS = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM, errno.EBADF
+})
+
+
+# ioctl request number for FICLONE (_IOW(0x94, 9, int)) on Linux
+_FICLONE = 0x40049409
+
+
+def _clone_file(src_fd: int, dst_fd: int) -> bool:
+    """
+    Share src's blocks with dst on a copy-on-write filesystem (btrfs, XFS).
+    
+    Returns:
+        True if dst is now a clone of src, False if cloning is unsupported
+    """
+    import fcntl
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        return True
+    except OSError as e:
+        if e.errno not in _KERNEL_COPY_FALLBACK_ERRNOS and e.errno != errno.ENOTTY:
+            raise
+        return False
+
+
+_clonefile = None
+
+
+def _clone_file_macos(src: str, dst: str) -> bool:
+    """
+    Clone src to dst with clonefile(2) on APFS.
+    
+    Returns:
+        True if dst was created as a clone, False if the caller must copy
+    """
+    global _clonefile
+    if _clonefile is None:
+        import ctypes
+        try:
+            libc = ctypes.CDLL("libSystem.dylib", use_errno=True)
+            _clonefile = libc.clonefile
+            _clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+            _clonefile.restype = ctypes.c_int
+        except (OSError, AttributeError):
+            _clonefile = False
+    if not _clonefile:
+        return False
+    # clonefile refuses to overwrite, so only use it for new files
+    if os.path.lexists(dst):
+        return False
+    return _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+
+
+def _copy_in_kernel(src_fd: int, dst_fd: int) -> bool:
+    """
+    Copy between two Linux file descriptors without user-space buffers.
+    
+    Tries a FICLONE reflink, then copy_file_range (which lets
+    copy-on-write filesystems share blocks) and then sendfile.
+    
+    Returns:
+        True if the whole file was copied, False if the caller must copy
+    """
+    if _clone_file(src_fd, dst_fd):
+        return True
+    
+    size = os.fstat(src_fd).st_size
+    
+    if hasattr(os, 'copy_file_range'):
+        try:
+            remaining = size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            if remaining == 0:
+                return True
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_FALLBACK_ERRNOS:
+                raise
+        
+        # Start over from a clean destination
+        os.lseek(src_fd, 0, os.SEEK_SET)
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        os.ftruncate(dst_fd, 0)
+    
+    try:
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+        return offset == size
+    except OSError as e:
+        if e.errno not in _KERNEL_COPY_FALLBACK_ERRNOS:
+            raise
+        return False
+
+
+def _copy_pdf(src: str, dst: str) -> None:
+    """
+    Copy a file's contents (not metadata) from src to dst.
+    
+    On Linux the data stays in the kernel when possible, otherwise it is
+    copied through a PDF_COPY_BUFSIZE buffer. macOS clones the file on
+    APFS. Other cases use shutil.copyfile, which already uses fcopyfile
+    on macOS and 1 MiB reads on Windows.
+    """
+    if sys.platform == 'darwin' and _clone_file_macos(src, dst):
+        return
+    if not sys.platform.startswith('linux'):
+        shutil.copyfile(src, dst)
+        return
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        if _copy_in_kernel(fsrc.fileno(), fdst.fileno()):
+            return
+        
+        # Discard anything a partial kernel copy left behind
+        fsrc.seek(0)
+        fdst.seek(0)
+        fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst, PDF_COPY_BUFSIZE)
+
+
+# BibTeX helpers: runs of non-alphanumerics (str.isalnum() complement) and
+# line breaks, which are flattened to spaces in abstracts
+_NON_ALNUM = re.compile(r'[\W_]+')
+_NEWLINES_TO_SPACES = str.maketrans('\n\r', '  ')
+
+# Stored 'read' values (lowercased) that mean the paper has been read
+_READ_VALUES = frozenset({'yes', 'true', '1', 'checked'})
+
+
+def _is_read_value(value) -> bool:
+    """Whether a stored 'read' value means the paper has been read."""
+    return bool(value) and str(value).lower() in _READ_VALUES
+
+
+@lru_cache(maxsize=256)
+def _bibtex_entry_type(record_type: str) -> str:
+    """Map a paper type to its BibTeX entry type (cached per distinct type)."""
+    record_type = record_type.lower()
+    if 'book' in record_type:
+        return "book"
+    if 'conference' in record_type or 'proceeding' in record_type:
+        return "inproceedings"
+    return "article"
+
 
 class ImportWorker(QThread):
     """Background worker for Excel import operations."""
@@ -60,9 +290,9 @@ class ImportWorker(QThread):
     
     def run(self):
         try:
-            # Import the migration function
-            sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-            from scripts.migrate_from_excel import build_db
+            build_db = _load_build_db()
+            if build_db is None:
+                raise ImportError(f"Excel import is unavailable: {_build_db_error}")
             
             self.progress.emit("Starting Excel import...")
             build_db(self.excel_path, self.db_path)
@@ -72,6 +302,352 @@ class ImportWorker(QThread):
             error_msg = f"Import failed: {str(e)}"
             logger.error(f"Import error: {e}\n{traceback.format_exc()}")
             self.finished.emit(False, error_msg)
+        finally:
+            # Connections are cached per thread; release this worker's
+            close_connections()
+
+
+class LookupLoader(QThread):
+    """Background worker that loads relates_to and project_id options."""
+    
+    loaded = pyqtSignal(list, list)
+    
+    def __init__(self, db_path: str):
+        super().__init__()
+        self.db_path = db_path
+    
+    def run(self):
+        try:
+            relates_options, project_options = get_lookup_bundle(self.db_path)
+            self.loaded.emit(relates_options, project_options)
+        finally:
+            # Connections are cached per thread; release this worker's
+            close_connections()
+
+
+class ZoteroExportWorker(QThread):
+    """Background worker writing a Zotero export folder."""
+    
+    # (value, maximum, label) for the dialog's progress bar
+    progress = pyqtSignal(int, int, str)
+    finished = pyqtSignal(bool, str)
+    
+    # Concurrent PDF copies; copying is I/O bound so threads overlap well
+    COPY_WORKERS = 8
+    
+    # Report progress (and check for cancellation) only every N items
+    PROGRESS_INTERVAL = 32
+    
+    # Buffer size for the streamed BibTeX and CSV files
+    WRITE_BUFFER_SIZE = 1 << 20
+    
+    def __init__(self, records: List[Dict[str, Any]], pdf_root: Optional[str], export_path: str,
+                 include_pdfs: bool = True, create_bibtex: bool = True, create_csv: bool = True):
+        super().__init__()
+        self.records = records
+        self.pdf_root = pdf_root
+        self.export_path = export_path
+        self.include_pdfs = include_pdfs
+        self.create_bibtex = create_bibtex
+        self.create_csv = create_csv
+    
+    def run(self):
+        try:
+            self.perform_export(self.export_path)
+            self.finished.emit(True, f"Successfully exported {len(self.records)} papers to:\n{self.export_path}")
+            
+        except InterruptedError:
+            self.finished.emit(False, "Export cancelled")
+        except Exception as e:
+            logger.error(f"Zotero export error: {e}\n{traceback.format_exc()}")
+            self.finished.emit(False, f"Failed to export papers: {e}")
+    
+    def check_cancelled(self):
+        """Stop the export if the dialog asked for it."""
+        if self.isInterruptionRequested():
+            raise InterruptedError("Export cancelled")
+    
+    def perform_export(self, export_path):
+        """Write the export folder, reporting progress as it goes."""
+        import csv
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from contextlib import ExitStack
+        from operator import itemgetter
+        
+        # Create subdirectories
+        if self.include_pdfs:
+            pdf_dir = os.path.join(export_path, "PDFs")
+            os.makedirs(pdf_dir, exist_ok=True)
+        
+        # List the PDF folder once instead of stat-ing every candidate file
+        available_pdfs = set()
+        if self.include_pdfs and self.pdf_root:
+            try:
+                available_pdfs = set(os.listdir(self.pdf_root))
+            except OSError as e:
+                logger.warning(f"Cannot list PDF folder {self.pdf_root}: {e}")
+        
+        # PDF copies run on the pool while BibTeX and CSV are generated
+        executor = ThreadPoolExecutor(max_workers=self.COPY_WORKERS)
+        copy_futures = []
+        try:
+            # BibTeX and CSV are streamed to disk as records are processed
+            with ExitStack() as stack:
+                bibtex_file = None
+                if self.create_bibtex and self.records:
+                    bibtex_path = os.path.join(export_path, "papers.bib")
+                    bibtex_file = stack.enter_context(
+                        open(bibtex_path, 'w', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE)
+                    )
+                
+                csv_writer = None
+                if self.create_csv and self.records:
+                    csv_path = os.path.join(export_path, "papers_metadata.csv")
+                    csv_file = stack.enter_context(
+                        open(csv_path, 'w', newline='', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE)
+                    )
+                    # Rows are projected in C by itemgetter rather than
+                    # converted from dicts by DictWriter
+                    fieldnames = tuple(self.records[0])
+                    csv_values = itemgetter(*fieldnames)
+                    csv_writer = csv.writer(csv_file)
+                    csv_writer.writerow(fieldnames)
+                
+                total = len(self.records)
+                last_index = total - 1
+                for i, record in enumerate(self.records):
+                    if i % self.PROGRESS_INTERVAL == 0 or i == last_index:
+                        self.check_cancelled()
+                        self.progress.emit(i, total, f"Processing: {record.get('title', 'Untitled')[:50]}...")
+                    
+                    # Start PDF copy if requested and available; only the
+                    # contents matter to Zotero, so skip copying metadata
+                    if available_pdfs:
+                        unique_name = record.get('unique_name', '')
+                        if unique_name:
+                            pdf_filename = f"{unique_name}.pdf"
+                            if pdf_filename in available_pdfs:
+                                source_pdf = os.path.join(self.pdf_root, pdf_filename)
+                                dest_pdf = os.path.join(pdf_dir, pdf_filename)
+                                copy_futures.append(executor.submit(_copy_pdf, source_pdf, dest_pdf))
+                    
+                    # Write BibTeX entry, entries separated by a blank line
+                    if bibtex_file:
+                        if i:
+                            bibtex_file.write('\n\n')
+                        bibtex_file.write(self.create_bibtex_entry(record))
+                    
+                    # Write CSV row
+                    if csv_writer:
+                        csv_writer.writerow(csv_values(record))
+            
+            self.write_readme(export_path)
+            
+            if copy_futures:
+                for done, future in enumerate(as_completed(copy_futures), 1):
+                    future.result()  # Re-raise copy errors
+                    if done % self.PROGRESS_INTERVAL == 0 or done == len(copy_futures):
+                        self.check_cancelled()
+                        self.progress.emit(done, len(copy_futures), f"Copying PDFs ({done}/{len(copy_futures)})...")
+        finally:
+            # Drop copies not yet started (shutdown's cancel_futures needs 3.9)
+            for future in copy_futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+        
+        self.progress.emit(len(self.records), len(self.records), "Export complete!")
+    
+    def write_readme(self, export_path):
+        """Write the README describing an export."""
+        from datetime import datetime
+        
+        # Create README
+        readme_path = os.path.join(export_path, "README.txt")
+        with open(readme_path, 'w', encoding='utf-8') as f:
+            f.write(f"Papers Database Export\n")
+            f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Number of papers: {len(self.records)}\n\n")
+            f.write("Files included:\n")
+            if self.create_bibtex:
+                f.write("- papers.bib: BibTeX format for import into Zotero or other reference managers\n")
+            if self.create_csv:
+                f.write("- papers_metadata.csv: Complete metadata in CSV format\n")
+            if self.include_pdfs:
+                f.write("- PDFs/: Folder containing PDF files of the papers\n")
+            f.write("\nTo import into Zotero:\n")
+            f.write("1. Open Zotero\n")
+            f.write("2. Go to File > Import\n")
+            f.write("3. Select the papers.bib file\n")
+            f.write("4. Manually attach PDFs from the PDFs folder to each reference\n")
+    
+    def create_bibtex_entry(self, record):
+        """Create a BibTeX entry for a record."""
+        # Generate a BibTeX key
+        title = record.get('title', 'untitled')
+        year = record.get('year', '')
+        author_field = record.get('relates_to', '')  # This might be the author info
+        
+        # Clean title for key
+        title_clean = _NON_ALNUM.sub('', title)[:20]
+        key = f"{author_field}{year}{title_clean}".replace(' ', '')
+        
+        # Build BibTeX entry
+        entry_type = _bibtex_entry_type(record.get('type', ''))
+        
+        lines = [f"@{entry_type}{{{key},"]
+        
+        # Required/common fields
+        if record.get('title'):
+            lines.append(f'  title = {{{record["title"]}}},')
+        
+        if record.get('relates_to'):  # Using as author field
+            lines.append(f'  author = {{{record["relates_to"]}}},')
+        
+        if record.get('year'):
+            lines.append(f'  year = {{{record["year"]}}},')
+        
+        if record.get('published_in'):
+            lines.append(f'  journal = {{{record["published_in"]}}},')
+        
+        if record.get('doi'):
+            lines.append(f'  doi = {{{record["doi"]}}},')
+        
+        if record.get('abstract'):
+            # Clean abstract for BibTeX
+            abstract_clean = record['abstract'].translate(_NEWLINES_TO_SPACES)
+            lines.append(f'  abstract = {{{abstract_clean}}},')
+        
+        if record.get('type'):
+            lines.append(f'  note = {{Type: {record["type"]}}},')
+        
+        # Remove trailing comma from last line
+        if lines[-1].endswith(','):
+            lines[-1] = lines[-1][:-1]
+        
+        lines.append("}")
+        
+        return '\n'.join(lines)
+
+
+class PdfTaskSignals(QObject):
+    """Completion signal for PDF file tasks: (success, error message)."""
+    
+    finished = pyqtSignal(bool, str)
+
+
+class PdfCopyTask(QRunnable):
+    """Copy an uploaded PDF into the PDF folder on the global thread pool."""
+    
+    def __init__(self, src: str, dst: str):
+        super().__init__()
+        self.src = src
+        self.dst = dst
+        self.signals = PdfTaskSignals()
+    
+    def run(self):
+        try:
+            _copy_pdf(self.src, self.dst)
+            shutil.copystat(self.src, self.dst)
+            self.signals.finished.emit(True, "")
+        except OSError as e:
+            logger.error(f"PDF copy failed: {e}")
+            self.signals.finished.emit(False, str(e))
+
+
+class PdfDeleteTask(QRunnable):
+    """Remove PDF files on the global thread pool; missing files are ignored."""
+    
+    def __init__(self, pdf_root: str, names: List[str]):
+        super().__init__()
+        self.pdf_root = pdf_root
+        self.names = names
+        self.signals = PdfTaskSignals()
+    
+    def run(self):
+        # Unlink relative to one open handle on the folder where supported,
+        # so the folder path is resolved once rather than per file
+        dir_fd = None
+        if os.unlink in os.supports_dir_fd:
+            try:
+                dir_fd = os.open(self.pdf_root, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+            except OSError:
+                dir_fd = None
+        
+        errors = []
+        try:
+            for name in self.names:
+                try:
+                    if dir_fd is not None and os.path.basename(name) == name:
+                        os.unlink(name, dir_fd=dir_fd)
+                    else:
+                        os.remove(os.path.join(self.pdf_root, name))
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    errors.append(f"Could not delete PDF {name}: {e}")
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        self.signals.finished.emit(not errors, "\n".join(errors))
+
+
+class LazyLookupCombo(QComboBox):
+    """
+    Editable lookup combo that queries its options on first use.
+    
+    Until the popup is opened or the combo gains focus it only shows the
+    current code, so dialogs that never touch it skip the lookup query.
+    """
+    
+    def __init__(self, load_options, current: str = "", parent=None):
+        super().__init__(parent)
+        self.setEditable(True)
+        self.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.load_options = load_options
+        self.loaded = False
+        self.row_by_code: Dict[str, int] = {}
+        if current:
+            self.setEditText(current)
+    
+    def ensure_loaded(self):
+        """Load the options once, keeping the value currently shown."""
+        if self.loaded:
+            return
+        self.loaded = True
+        
+        current = self.currentText().strip().split(' - ')[0]
+        options = self.load_options()
+        
+        model = QStandardItemModel(self)
+        labels = [f"{option['id']} - {option['name']}" for option in options]
+        for label, option in zip(labels, options):
+            item = QStandardItem(label)
+            item.setData(option['id'], Qt.ItemDataRole.UserRole)
+            model.appendRow(item)
+        
+        self.setModel(model)
+        
+        completer = QCompleter(model, self)
+        completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.setCompleter(completer)
+        
+        # Select the current value, or keep it as free text if not an option
+        self.row_by_code = {option['id']: row for row, option in enumerate(options)}
+        if current:
+            index = self.row_by_code.get(current, -1)
+            if index >= 0:
+                self.setCurrentIndex(index)
+            else:
+                self.setCurrentText(current)
+    
+    def showPopup(self):
+        self.ensure_loaded()
+        super().showPopup()
+    
+    def focusInEvent(self, event):
+        self.ensure_loaded()
+        super().focusInEvent(event)
 
 
 class RecordDialog(QDialog):
@@ -137,44 +713,24 @@ class RecordDialog(QDialog):
         form_layout.addRow("DOI:", doi_layout)
         self.fields['doi'] = self.doi_edit
         
-        # Relates To (dropdown)
-        self.relates_combo = QComboBox()
-        self.relates_combo.setEditable(True)
-        if self.db_path:
-            relates_options = get_relates_to_options(self.db_path)
-            for option in relates_options:
-                self.relates_combo.addItem(f"{option['id']} - {option['name']}", option['id'])
-        current_relates = self.record_data.get('relates_to', '')
-        if current_relates:
-            index = self.relates_combo.findData(current_relates)
-            if index >= 0:
-                self.relates_combo.setCurrentIndex(index)
-            else:
-                self.relates_combo.setCurrentText(current_relates)
+        # Relates To (dropdown, options loaded on first use)
+        self.relates_combo = LazyLookupCombo(
+            lambda: get_relates_to_options(self.db_path) if self.db_path else [],
+            self.record_data.get('relates_to', '') or '')
         form_layout.addRow("Relates To:", self.relates_combo)
         self.fields['relates_to'] = self.relates_combo
         
-        # Project ID (dropdown)
-        self.project_combo = QComboBox()
-        self.project_combo.setEditable(True)
-        if self.db_path:
-            project_options = get_project_id_options(self.db_path)
-            for option in project_options:
-                self.project_combo.addItem(f"{option['id']} - {option['name']}", option['id'])
-        current_project = self.record_data.get('project_id', '')
-        if current_project:
-            index = self.project_combo.findData(current_project)
-            if index >= 0:
-                self.project_combo.setCurrentIndex(index)
-            else:
-                self.project_combo.setCurrentText(current_project)
+        # Project ID (dropdown, options loaded on first use)
+        self.project_combo = LazyLookupCombo(
+            lambda: get_project_id_options(self.db_path) if self.db_path else [],
+            self.record_data.get('project_id', '') or '')
         form_layout.addRow("Project:", self.project_combo)
         self.fields['project_id'] = self.project_combo
         
         # Read checkbox
         self.read_checkbox = QCheckBox()
         read_value = self.record_data.get('read', '')
-        self.read_checkbox.setChecked(bool(read_value and read_value.lower() in ['yes', 'true', '1', 'checked']))
+        self.read_checkbox.setChecked(_is_read_value(read_value))
         form_layout.addRow("Read:", self.read_checkbox)
         self.fields['read'] = self.read_checkbox
         
@@ -214,12 +770,7 @@ class RecordDialog(QDialog):
                 else:
                     doi = f"https://doi.org/{doi}"
             
-            if platform.system() == "Windows":
-                os.startfile(doi)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", doi])
-            else:  # Linux
-                subprocess.run(["xdg-open", doi])
+            _open_with_system(doi)
     
     def browse_pdf(self):
         """Browse for PDF file to upload."""
@@ -267,12 +818,47 @@ class RecordDialog(QDialog):
         return data
 
 
+class LookupModel(QAbstractTableModel):
+    """Read-only table model over a list of lookup option dictionaries."""
+    
+    HEADERS = ("Code", "Name", "Description")
+    KEYS = ('id', 'name', 'description')
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows: List[Dict[str, str]] = []
+    
+    def set_rows(self, rows: List[Dict[str, str]]):
+        """Replace all rows; views only query the cells they display."""
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.KEYS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self.rows[index.row()][self.KEYS[index.column()]] or ''
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class CategoriesDialog(QDialog):
     """Dialog for managing categories (relates_to and project_id)."""
     
     def __init__(self, parent=None, db_path: str = None):
         super().__init__(parent)
         self.db_path = db_path
+        self.loader = None
+        self.reload_pending = False
         
         self.setWindowTitle("Manage Categories")
         self.setModal(True)
@@ -294,9 +880,11 @@ class CategoriesDialog(QDialog):
         relates_layout.addWidget(QLabel("Research Categories (Relates To):"))
         
         # Relates To table
-        self.relates_table = QTableWidget()
-        self.relates_table.setColumnCount(3)
-        self.relates_table.setHorizontalHeaderLabels(["Code", "Name", "Description"])
+        self.relates_model = LookupModel(self)
+        self.relates_table = QTableView()
+        self.relates_table.setModel(self.relates_model)
+        self.relates_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.relates_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         relates_layout.addWidget(self.relates_table)
         
         # Relates To buttons
@@ -324,9 +912,11 @@ class CategoriesDialog(QDialog):
         project_layout.addWidget(QLabel("Projects (Project ID):"))
         
         # Project ID table
-        self.project_table = QTableWidget()
-        self.project_table.setColumnCount(3)
-        self.project_table.setHorizontalHeaderLabels(["Code", "Name", "Description"])
+        self.project_model = LookupModel(self)
+        self.project_table = QTableView()
+        self.project_table.setModel(self.project_model)
+        self.project_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.project_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         project_layout.addWidget(self.project_table)
         
         # Project ID buttons
@@ -349,33 +939,55 @@ class CategoriesDialog(QDialog):
         
         layout.addWidget(tabs)
         
+        # Busy indicator shown while categories load in the background
+        self.loading_bar = QProgressBar()
+        self.loading_bar.setRange(0, 0)
+        self.loading_bar.setFormat("Loading...")
+        self.loading_bar.setTextVisible(True)
+        self.loading_bar.setVisible(False)
+        layout.addWidget(self.loading_bar)
+        
         # Close button
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         button_box.rejected.connect(self.accept)
         layout.addWidget(button_box)
     
     def load_data(self):
-        """Load category data into tables."""
+        """Load category data into tables without blocking the UI."""
         if not self.db_path:
             return
         
-        # Load relates_to options
-        relates_options = get_relates_to_options(self.db_path)
-        self.relates_table.setRowCount(len(relates_options))
+        if self.loader and self.loader.isRunning():
+            # Reload once the current load finishes so edits are picked up
+            self.reload_pending = True
+            return
         
-        for row, option in enumerate(relates_options):
-            self.relates_table.setItem(row, 0, QTableWidgetItem(option['id']))
-            self.relates_table.setItem(row, 1, QTableWidgetItem(option['name']))
-            self.relates_table.setItem(row, 2, QTableWidgetItem(option['description'] or ''))
+        self.loading_bar.setVisible(True)
+        self.loader = LookupLoader(self.db_path)
+        self.loader.loaded.connect(self.on_data_loaded)
+        self.loader.finished.connect(self.on_loader_finished)
+        self.loader.start()
+    
+    def on_data_loaded(self, relates_options: list, project_options: list):
+        """Populate the tables with options loaded by the worker."""
+        # Load relates_to options
+        self.relates_model.set_rows(relates_options)
         
         # Load project_id options
-        project_options = get_project_id_options(self.db_path)
-        self.project_table.setRowCount(len(project_options))
-        
-        for row, option in enumerate(project_options):
-            self.project_table.setItem(row, 0, QTableWidgetItem(option['id']))
-            self.project_table.setItem(row, 1, QTableWidgetItem(option['name']))
-            self.project_table.setItem(row, 2, QTableWidgetItem(option['description'] or ''))
+        self.project_model.set_rows(project_options)
+    
+    def on_loader_finished(self):
+        """Hide the busy indicator or start a reload requested meanwhile."""
+        self.loading_bar.setVisible(False)
+        if self.reload_pending:
+            self.reload_pending = False
+            self.load_data()
+    
+    def done(self, result):
+        # The worker thread must not outlive the dialog
+        if self.loader and self.loader.isRunning():
+            self.loader.wait()
+        super().done(result)
     
     def add_relates_category(self):
         """Add new relates_to category."""
@@ -390,14 +1002,15 @@ class CategoriesDialog(QDialog):
     
     def edit_relates_category(self):
         """Edit selected relates_to category."""
-        current_row = self.relates_table.currentRow()
+        current_row = self.relates_table.currentIndex().row()
         if current_row < 0:
             QMessageBox.warning(self, "No Selection", "Please select a category to edit")
             return
         
-        code = self.relates_table.item(current_row, 0).text()
-        name = self.relates_table.item(current_row, 1).text()
-        description = self.relates_table.item(current_row, 2).text()
+        option = self.relates_model.rows[current_row]
+        code = option['id']
+        name = option['name']
+        description = option['description'] or ''
         
         dialog = CategoryEditDialog(self, "Edit Research Category", code, name, description)
         if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -410,12 +1023,12 @@ class CategoriesDialog(QDialog):
     
     def delete_relates_category(self):
         """Delete selected relates_to category."""
-        current_row = self.relates_table.currentRow()
+        current_row = self.relates_table.currentIndex().row()
         if current_row < 0:
             QMessageBox.warning(self, "No Selection", "Please select a category to delete")
             return
         
-        code = self.relates_table.item(current_row, 0).text()
+        code = self.relates_model.rows[current_row]['id']
         reply = QMessageBox.question(self, "Confirm Delete", 
                                     f"Delete category '{code}'?\nThis is only possible if no papers use this category.")
         
@@ -439,14 +1052,15 @@ class CategoriesDialog(QDialog):
     
     def edit_project(self):
         """Edit selected project."""
-        current_row = self.project_table.currentRow()
+        current_row = self.project_table.currentIndex().row()
         if current_row < 0:
             QMessageBox.warning(self, "No Selection", "Please select a project to edit")
             return
         
-        code = self.project_table.item(current_row, 0).text()
-        name = self.project_table.item(current_row, 1).text()
-        description = self.project_table.item(current_row, 2).text()
+        option = self.project_model.rows[current_row]
+        code = option['id']
+        name = option['name']
+        description = option['description'] or ''
         
         dialog = CategoryEditDialog(self, "Edit Project", code, name, description)
         if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -459,12 +1073,12 @@ class CategoriesDialog(QDialog):
     
     def delete_project(self):
         """Delete selected project."""
-        current_row = self.project_table.currentRow()
+        current_row = self.project_table.currentIndex().row()
         if current_row < 0:
             QMessageBox.warning(self, "No Selection", "Please select a project to delete")
             return
         
-        code = self.project_table.item(current_row, 0).text()
+        code = self.project_model.rows[current_row]['id']
         reply = QMessageBox.question(self, "Confirm Delete", 
                                     f"Delete project '{code}'?\nThis is only possible if no papers use this project.")
         
@@ -476,6 +1090,26 @@ class CategoriesDialog(QDialog):
                 QMessageBox.warning(self, "Error", "Cannot delete project - it may be used by existing papers")
 
 
+@lru_cache(maxsize=512)
+def _category_code(name: str) -> str:
+    """Generate a 4-letter code from a name using first 2 + last 2 letters."""
+    # Convert to uppercase and keep letters only (drops whitespace too)
+    clean_name = ''.join(filter(str.isalpha, name.upper()))
+    
+    if len(clean_name) < 2:
+        # If name is too short, pad with 'X'
+        return (clean_name + 'XXXX')[:4]
+    elif len(clean_name) == 2:
+        # If exactly 2 letters, repeat them
+        return clean_name + clean_name
+    elif len(clean_name) == 3:
+        # If 3 letters, use first 2 and last 1, then repeat last
+        return clean_name[:2] + clean_name[-1] + clean_name[-1]
+    else:
+        # Standard case: first 2 + last 2 letters
+        return clean_name[:2] + clean_name[-2:]
+
+
 class CategoryEditDialog(QDialog):
     """Dialog for editing a single category or project."""
     
@@ -495,8 +1129,12 @@ class CategoryEditDialog(QDialog):
         layout.addRow("Code (auto-generated):", self.code_edit)
         
         self.name_edit = QLineEdit(name)
-        # Always connect name changes to auto-generate code
-        self.name_edit.textChanged.connect(self.auto_generate_code)
+        # Regenerate the code once typing pauses rather than on every keystroke
+        self.code_timer = QTimer(self)
+        self.code_timer.setSingleShot(True)
+        self.code_timer.setInterval(50)
+        self.code_timer.timeout.connect(self.auto_generate_code)
+        self.name_edit.textChanged.connect(self.code_timer.start)
         layout.addRow("Name:", self.name_edit)
         
         # Generate initial code if this is a new entry and name is provided
@@ -526,29 +1164,15 @@ class CategoryEditDialog(QDialog):
             self.code_edit.setText("")
             return
         
-        # Remove spaces and convert to uppercase
-        clean_name = ''.join(name.split()).upper()
-        
-        # Remove non-alphabetic characters
-        clean_name = ''.join(c for c in clean_name if c.isalpha())
-        
-        if len(clean_name) < 2:
-            # If name is too short, pad with 'X'
-            code = (clean_name + 'XXXX')[:4]
-        elif len(clean_name) == 2:
-            # If exactly 2 letters, repeat them
-            code = clean_name + clean_name
-        elif len(clean_name) == 3:
-            # If 3 letters, use first 2 and last 1, then repeat last
-            code = clean_name[:2] + clean_name[-1] + clean_name[-1]
-        else:
-            # Standard case: first 2 + last 2 letters
-            code = clean_name[:2] + clean_name[-2:]
-        
-        self.code_edit.setText(code)
+        self.code_edit.setText(_category_code(name))
     
     def get_data(self):
         """Return the entered data."""
+        # Apply a code update still waiting on the debounce timer
+        if self.code_timer.isActive():
+            self.code_timer.stop()
+            self.auto_generate_code()
+        
         return (
             self.code_edit.text().strip().upper(),
             self.name_edit.text().strip(),
@@ -563,6 +1187,7 @@ class ZoteroExportDialog(QDialog):
         super().__init__(parent)
         self.records = records or []
         self.pdf_root = pdf_root
+        self.export_worker = None
         
         self.setWindowTitle("Export to Zotero")
         self.setModal(True)
@@ -617,11 +1242,17 @@ class ZoteroExportDialog(QDialog):
         
         self.preview_list = QListWidget()
         self.preview_list.setMaximumHeight(150)
+        labels = []
         for record in self.records:
             title = record.get('title', 'Untitled')
             year = record.get('year', '')
             year_str = f" ({year})" if year else ""
-            self.preview_list.addItem(f"{title}{year_str}")
+            labels.append(f"{title}{year_str}")
+        
+        # Insert all items in one call without per-item repaints
+        self.preview_list.setUpdatesEnabled(False)
+        self.preview_list.addItems(labels)
+        self.preview_list.setUpdatesEnabled(True)
         
         preview_layout.addWidget(self.preview_list)
         layout.addWidget(preview_group)
@@ -677,148 +1308,47 @@ class ZoteroExportDialog(QDialog):
         self.progress_bar.setValue(0)
         self.export_btn.setEnabled(False)
         
-        try:
-            self.perform_export(export_path)
-            QMessageBox.information(self, "Export Complete", 
-                                  f"Successfully exported {len(self.records)} papers to:\n{export_path}")
-            self.accept()
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export papers: {e}")
-        finally:
-            self.export_btn.setEnabled(True)
-            self.progress_bar.setVisible(False)
-    
-    def perform_export(self, export_path):
-        """Perform the actual export."""
-        import shutil
-        from datetime import datetime
-        
-        # Create subdirectories
-        if self.include_pdfs_cb.isChecked():
-            pdf_dir = os.path.join(export_path, "PDFs")
-            os.makedirs(pdf_dir, exist_ok=True)
-        
-        # Prepare data for BibTeX and CSV
-        bibtex_entries = []
-        csv_data = []
-        
-        for i, record in enumerate(self.records):
-            self.status_label.setText(f"Processing: {record.get('title', 'Untitled')[:50]}...")
-            self.progress_bar.setValue(i)
-            QApplication.processEvents()  # Keep UI responsive
-            
-            # Copy PDF if requested and available
-            if self.include_pdfs_cb.isChecked() and self.pdf_root:
-                unique_name = record.get('unique_name', '')
-                if unique_name:
-                    pdf_filename = f"{unique_name}.pdf"
-                    source_pdf = os.path.join(self.pdf_root, pdf_filename)
-                    if os.path.exists(source_pdf):
-                        dest_pdf = os.path.join(pdf_dir, pdf_filename)
-                        shutil.copy2(source_pdf, dest_pdf)
-            
-            # Prepare BibTeX entry
-            if self.create_bibtex_cb.isChecked():
-                bibtex_entry = self.create_bibtex_entry(record)
-                bibtex_entries.append(bibtex_entry)
-            
-            # Prepare CSV data
-            if self.create_csv_cb.isChecked():
-                csv_data.append(record)
-        
-        # Write BibTeX file
-        if self.create_bibtex_cb.isChecked() and bibtex_entries:
-            bibtex_path = os.path.join(export_path, "papers.bib")
-            with open(bibtex_path, 'w', encoding='utf-8') as f:
-                f.write('\n\n'.join(bibtex_entries))
-        
-        # Write CSV file
-        if self.create_csv_cb.isChecked() and csv_data:
-            import csv
-            csv_path = os.path.join(export_path, "papers_metadata.csv")
-            if csv_data:
-                fieldnames = csv_data[0].keys()
-                with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(csv_data)
-        
-        # Create README
-        readme_path = os.path.join(export_path, "README.txt")
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(f"Papers Database Export\n")
-            f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Number of papers: {len(self.records)}\n\n")
-            f.write("Files included:\n")
-            if self.create_bibtex_cb.isChecked():
-                f.write("- papers.bib: BibTeX format for import into Zotero or other reference managers\n")
-            if self.create_csv_cb.isChecked():
-                f.write("- papers_metadata.csv: Complete metadata in CSV format\n")
-            if self.include_pdfs_cb.isChecked():
-                f.write("- PDFs/: Folder containing PDF files of the papers\n")
-            f.write("\nTo import into Zotero:\n")
-            f.write("1. Open Zotero\n")
-            f.write("2. Go to File > Import\n")
-            f.write("3. Select the papers.bib file\n")
-            f.write("4. Manually attach PDFs from the PDFs folder to each reference\n")
+        # Export in the background so the dialog stays responsive
+        self.export_worker = ZoteroExportWorker(
+            list(self.records), self.pdf_root, export_path,
+            include_pdfs=self.include_pdfs_cb.isChecked(),
+            create_bibtex=self.create_bibtex_cb.isChecked(),
+            create_csv=self.create_csv_cb.isChecked()
+        )
+        self.export_worker.progress.connect(self.on_export_progress)
+        self.export_worker.finished.connect(self.on_export_finished)
+        self.export_worker.start()
+    
+    def on_export_progress(self, value: int, maximum: int, label: str):
+        """Show export progress reported by the worker."""
+        self.progress_bar.setMaximum(maximum)
+        self.progress_bar.setValue(value)
+        self.status_label.setText(label)
+    
+    def on_export_finished(self, success: bool, message: str):
+        """Report the export result and close on success."""
+        cancelled = self.export_worker.isInterruptionRequested()
+        self.export_worker = None
+        self.export_btn.setEnabled(True)
+        self.progress_bar.setVisible(False)
         
-        self.progress_bar.setValue(len(self.records))
-        self.status_label.setText("Export complete!")
+        if success:
+            QMessageBox.information(self, "Export Complete", message)
+            self.accept()
+        elif cancelled:
+            super().reject()
+        else:
+            self.status_label.setText("")
+            QMessageBox.critical(self, "Export Error", message)
+    
+    def reject(self):
+        """Cancel a running export, or close the dialog."""
+        if self.export_worker is not None and self.export_worker.isRunning():
+            self.export_worker.requestInterruption()
+            self.status_label.setText("Cancelling...")
+            return
+        super().reject()
     
-    def create_bibtex_entry(self, record):
-        """Create a BibTeX entry for a record."""
-        # Generate a BibTeX key
-        title = record.get('title', 'untitled')
-        year = record.get('year', '')
-        author_field = record.get('relates_to', '')  # This might be the author info
-        
-        # Clean title for key
-        title_clean = ''.join(c for c in title if c.isalnum())[:20]
-        key = f"{author_field}{year}{title_clean}".replace(' ', '')
-        
-        # Build BibTeX entry
-        entry_type = "article"  # Default to article
-        record_type = record.get('type', '').lower()
-        if 'book' in record_type:
-            entry_type = "book"
-        elif 'conference' in record_type or 'proceeding' in record_type:
-            entry_type = "inproceedings"
-        
-        lines = [f"@{entry_type}{{{key},"]
-        
-        # Required/common fields
-        if record.get('title'):
-            lines.append(f'  title = {{{record["title"]}}},')
-        
-        if record.get('relates_to'):  # Using as author field
-            lines.append(f'  author = {{{record["relates_to"]}}},')
-        
-        if record.get('year'):
-            lines.append(f'  year = {{{record["year"]}}},')
-        
-        if record.get('published_in'):
-            lines.append(f'  journal = {{{record["published_in"]}}},')
-        
-        if record.get('doi'):
-            lines.append(f'  doi = {{{record["doi"]}}},')
-        
-        if record.get('abstract'):
-            # Clean abstract for BibTeX
-            abstract_clean = record['abstract'].replace('\n', ' ').replace('\r', ' ')
-            lines.append(f'  abstract = {{{abstract_clean}}},')
-        
-        if record.get('type'):
-            lines.append(f'  note = {{Type: {record["type"]}}},')
-        
-        # Remove trailing comma from last line
-        if lines[-1].endswith(','):
-            lines[-1] = lines[-1][:-1]
-        
-        lines.append("}")
-        
-        return '\n'.join(lines)
-
-
 class SettingsDialog(QDialog):
     """Dialog for application settings."""
     
@@ -955,14 +1485,111 @@ class SettingsDialog(QDialog):
             QMessageBox.critical(self, "Error", f"Failed to save settings: {e}")
 
 
+class RecordsModel(QAbstractTableModel):
+    """
+    Read-only table model over the main window's record dictionaries.
+    
+    Cells are formatted when the view asks for them, so only visible rows
+    cost anything. Sorting reorders the record list in place, keeping row
+    numbers aligned with MainWindow.current_records.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.records: List[Dict[str, Any]] = []
+        self.columns: List[str] = []
+    
+    def set_columns(self, columns: List[str]):
+        """Replace the displayed columns."""
+        self.beginResetModel()
+        self.columns = list(columns)
+        self.endResetModel()
+    
+    def set_records(self, records: List[Dict[str, Any]]):
+        """Replace all records; the list is shared, not copied."""
+        self.beginResetModel()
+        self.records = records
+        self.endResetModel()
+    
+    @staticmethod
+    def is_read(record: Dict[str, Any]) -> bool:
+        """Whether a record's read column holds a truthy value."""
+        return _is_read_value(record.get('read'))
+    
+    def display_text(self, record: Dict[str, Any], column: str) -> str:
+        """Text shown for one cell; the read column renders as a checkbox."""
+        if column == 'read':
+            return "☑" if self.is_read(record) else "☐"
+        value = record.get(column)
+        return '' if value is None else str(value)
+    
+    def record_changed(self, row: int):
+        """Repaint a row after its record dictionary was modified."""
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.columns) - 1))
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        record = self.records[index.row()]
+        column = self.columns[index.column()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display_text(record, column)
+        if role == Qt.ItemDataRole.UserRole:
+            return record.get('id')
+        if role == Qt.ItemDataRole.TextAlignmentRole and column == 'read':
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.columns[section].replace('_', ' ').title()
+        return super().headerData(section, orientation, role)
+    
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort by a column's displayed text, keeping selections attached."""
+        if not 0 <= column < len(self.columns):
+            return
+        
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        persistent_records = [self.records[index.row()] for index in persistent]
+        
+        key = self.columns[column]
+        self.records.sort(
+            key=lambda record: self.display_text(record, key),
+            reverse=order == Qt.SortOrder.DescendingOrder
+        )
+        
+        rows = {id(record): row for row, record in enumerate(self.records)}
+        self.changePersistentIndexList(persistent, [
+            self.index(rows[id(record)], index.column())
+            for record, index in zip(persistent_records, persistent)
+        ])
+        self.layoutChanged.emit()
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
     
+    # Columns kept out of the table view
+    HIDDEN_COLUMNS = frozenset({
+        'id', 'unique_name', 'pdf', 'created_at', 'updated_at', 'added_date',
+        'url', 'entry_number', 'journal', 'authors', 'keywords', 'tags', 'notes', 'status'
+    })
+    
     def __init__(self):
         super().__init__()
         self.settings = get_settings()
         self.current_records = []
         self.columns = []
+        self.display_columns = []
         
         self.setWindowTitle("Papers Desktop Database")
         self.resize(1200, 800)
@@ -983,13 +1610,14 @@ class MainWindow(QMainWindow):
             self.load_database()
         else:
             # Check if test database exists in current directory
-            test_db_path = os.path.join(os.getcwd(), "test_papers.db")
-            test_pdf_path = os.path.join(os.path.dirname(os.getcwd()), "PDFs")
+            cwd = os.getcwd()
+            test_db_path = os.path.join(cwd, "test_papers.db")
             
-            if os.path.exists(test_db_path):
+            if os.path.isfile(test_db_path):
                 # Auto-configure with test database
                 self.settings.db_path = test_db_path
-                if os.path.exists(test_pdf_path):
+                test_pdf_path = os.path.join(os.path.dirname(cwd), "PDFs")
+                if os.path.isdir(test_pdf_path):
                     self.settings.pdf_root = test_pdf_path
                 
                 self.status_bar.showMessage("Auto-configured with test database")
@@ -1008,11 +1636,19 @@ class MainWindow(QMainWindow):
         filter_group = QGroupBox("Search & Filter")
         filter_layout = QHBoxLayout(filter_group)
         
+        # Edits reload the table once typing pauses; Enter and the Search
+        # button reload immediately
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.load_records)
+        
         # Search box
         filter_layout.addWidget(QLabel("Search:"))
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Enter search terms...")
         self.search_edit.returnPressed.connect(self.search_records)
+        self.search_edit.textChanged.connect(self.search_timer.start)
         filter_layout.addWidget(self.search_edit)
         
         # Year filter
@@ -1020,12 +1656,16 @@ class MainWindow(QMainWindow):
         self.year_edit = QLineEdit()
         self.year_edit.setPlaceholderText("2024")
         self.year_edit.setMaximumWidth(80)
+        self.year_edit.returnPressed.connect(self.search_records)
+        self.year_edit.textChanged.connect(self.search_timer.start)
         filter_layout.addWidget(self.year_edit)
         
         # Journal filter
         filter_layout.addWidget(QLabel("Journal:"))
         self.journal_edit = QLineEdit()
         self.journal_edit.setPlaceholderText("Contains...")
+        self.journal_edit.returnPressed.connect(self.search_records)
+        self.journal_edit.textChanged.connect(self.search_timer.start)
         filter_layout.addWidget(self.journal_edit)
         
         # Search button
@@ -1036,17 +1676,19 @@ class MainWindow(QMainWindow):
         # Sort dropdown
         filter_layout.addWidget(QLabel("Sort:"))
         self.sort_combo = QComboBox()
-        self.sort_combo.addItems([
-            "ID (Default)",
-            "Date Added (Newest)",
-            "Date Added (Oldest)", 
-            "Title (A-Z)",
-            "Title (Z-A)",
-            "Year (Newest)",
-            "Year (Oldest)"
-        ])
+        # Item data is the read_all sort order; the database does the sorting
+        for label, order_by in [
+            ("ID (Default)", 'id'),
+            ("Date Added (Newest)", 'created_desc'),
+            ("Date Added (Oldest)", 'created_asc'),
+            ("Title (A-Z)", 'title_asc'),
+            ("Title (Z-A)", 'title_desc'),
+            ("Year (Newest)", 'year_desc'),
+            ("Year (Oldest)", 'year_asc'),
+        ]:
+            self.sort_combo.addItem(label, order_by)
         self.sort_combo.setMaximumWidth(150)
-        self.sort_combo.currentTextChanged.connect(self.search_records)
+        self.sort_combo.currentIndexChanged.connect(self.on_sort_changed)
         filter_layout.addWidget(self.sort_combo)
         
         # Clear button
@@ -1057,16 +1699,20 @@ class MainWindow(QMainWindow):
         layout.addWidget(filter_group)
         
         # Table
-        self.table = QTableWidget()
+        self.records_model = RecordsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.records_model)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.table.setSortingEnabled(True)
+        # No header sort until a column is clicked; the sort combo applies
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         # Make table read-only - editing only through dialogs
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.doubleClicked.connect(self.edit_record)
         # Handle clicks for read checkbox functionality
-        self.table.cellClicked.connect(self.on_cell_clicked)
+        self.table.clicked.connect(self.on_cell_clicked)
         
         layout.addWidget(self.table)
         
@@ -1193,7 +1839,8 @@ class MainWindow(QMainWindow):
         """Load database and initialize table."""
         try:
             db_path = self.settings.db_path
-            if not db_path or not os.path.exists(db_path):
+            _forget_path(db_path)
+            if not db_path or not _path_exists(db_path):
                 self.status_bar.showMessage("Database not found")
                 return
             
@@ -1217,17 +1864,12 @@ class MainWindow(QMainWindow):
             return
         
         # Filter out unnecessary columns for display
-        hidden_columns = [
-            'id', 'unique_name', 'pdf', 'created_at', 'updated_at', 'added_date',
-            'url', 'entry_number', 'journal', 'authors', 'keywords', 'tags', 'notes', 'status'
-        ]
-        display_columns = [col for col in self.columns if col not in hidden_columns]
+        display_columns = [col for col in self.columns if col not in self.HIDDEN_COLUMNS]
         
         # Store all columns for internal use but only display the filtered ones
         self.display_columns = display_columns
         
-        self.table.setColumnCount(len(display_columns))
-        self.table.setHorizontalHeaderLabels([col.replace('_', ' ').title() for col in display_columns])
+        self.records_model.set_columns(display_columns)
         
         # Set column widths
         header = self.table.horizontalHeader()
@@ -1283,113 +1925,64 @@ class MainWindow(QMainWindow):
             if self.journal_edit.text().strip():
                 filters['journal'] = self.journal_edit.text().strip()
             
-            # Load records
-            self.current_records = read_all(db_path, search, filters, self.settings.search_limit)
-            
-            # Apply sorting
-            self.apply_sorting()
+            # Load records, sorted by the database
+            order_by = self.sort_combo.currentData() if hasattr(self, 'sort_combo') else None
+            self.current_records = read_all(db_path, search, filters, self.settings.search_limit, order_by)
             
             self.populate_table()
             
             count = len(self.current_records)
             self.status_bar.showMessage(f"Showing {count} records")
             
-        except DatabaseError as e:
+        except (DatabaseError, ValueError) as e:
             QMessageBox.critical(self, "Database Error", f"Failed to load records: {e}")
             self.status_bar.showMessage("Error loading records")
     
-    def apply_sorting(self):
-        """Apply sorting to current records based on sort dropdown selection."""
-        if not hasattr(self, 'sort_combo') or not self.current_records:
-            return
-        
-        sort_option = self.sort_combo.currentText()
-        
-        if sort_option == "ID (Default)":
-            # Sort by ID (ascending)
-            self.current_records.sort(key=lambda x: x.get('id', 0))
-        elif sort_option == "Date Added (Newest)":
-            # Sort by created_at (descending - newest first)
-            self.current_records.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        elif sort_option == "Date Added (Oldest)":
-            # Sort by created_at (ascending - oldest first)
-            self.current_records.sort(key=lambda x: x.get('created_at', ''))
-        elif sort_option == "Title (A-Z)":
-            # Sort by title (ascending)
-            self.current_records.sort(key=lambda x: (x.get('title', '') or '').lower())
-        elif sort_option == "Title (Z-A)":
-            # Sort by title (descending)
-            self.current_records.sort(key=lambda x: (x.get('title', '') or '').lower(), reverse=True)
-        elif sort_option == "Year (Newest)":
-            # Sort by year (descending - newest first)
-            self.current_records.sort(key=lambda x: x.get('year', 0) or 0, reverse=True)
-        elif sort_option == "Year (Oldest)":
-            # Sort by year (ascending - oldest first)
-            self.current_records.sort(key=lambda x: x.get('year', 0) or 0)
-    
     def populate_table(self):
-        """Populate table with current records."""
-        if not self.current_records:
-            self.table.setRowCount(0)
-            return
+        """Show current records in the table."""
+        self.records_model.set_records(self.current_records)
         
-        # Use the display columns we defined in setup_table_columns
-        display_columns = getattr(self, 'display_columns', self.columns)
-        
-        self.table.setRowCount(len(self.current_records))
-        
-        for row, record in enumerate(self.current_records):
-            for col, column_name in enumerate(display_columns):
-                value = record.get(column_name, '')
-                if value is None:
-                    value = ''
-                
-                # Handle read column as checkbox (display only)
-                if column_name == 'read':
-                    item = QTableWidgetItem()
-                    is_read = value and str(value).lower() in ['yes', 'true', '1', 'checked']
-                    # Use checkmark symbols for display only
-                    item.setText("☑" if is_read else "☐")
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    item.setData(Qt.ItemDataRole.UserRole, record['id'])  # Store record ID
-                    # Store the read status for toggling
-                    item.setData(Qt.ItemDataRole.UserRole + 1, is_read)
-                else:
-                    item = QTableWidgetItem(str(value))
-                    item.setData(Qt.ItemDataRole.UserRole, record['id'])  # Store record ID
-                
-                self.table.setItem(row, col, item)
+        # Keep a column sort chosen from the header across reloads
+        header = self.table.horizontalHeader()
+        section = header.sortIndicatorSection()
+        if self.current_records and 0 <= section < self.records_model.columnCount():
+            self.records_model.sort(section, header.sortIndicatorOrder())
     
-    def on_cell_clicked(self, row, col):
+    def on_cell_clicked(self, index):
         """Handle cell clicks - specifically for read checkbox toggling."""
-        display_columns = getattr(self, 'display_columns', [])
+        display_columns = self.display_columns
         
+        col = index.column()
         if col < len(display_columns) and display_columns[col] == 'read':
-            item = self.table.item(row, col)
-            if item:
-                record_id = item.data(Qt.ItemDataRole.UserRole)
-                current_read_status = item.data(Qt.ItemDataRole.UserRole + 1)
-                
-                if record_id:
-                    try:
-                        # Toggle read status
-                        new_status = not current_read_status
-                        new_value = 'Yes' if new_status else 'No'
-                        
-                        # Update database
-                        update_record(self.settings.db_path, record_id, {'read': new_value})
-                        
-                        # Update display
-                        item.setText("☑" if new_status else "☐")
-                        item.setData(Qt.ItemDataRole.UserRole + 1, new_status)
-                        
-                        self.status_bar.showMessage(f"Updated read status")
-                        
-                    except DatabaseError as e:
-                        QMessageBox.critical(self, "Database Error", f"Failed to update read status: {e}")
+            row = index.row()
+            record = self.current_records[row]
+            record_id = record.get('id')
+            
+            if record_id:
+                try:
+                    # Toggle read status
+                    new_status = not RecordsModel.is_read(record)
+                    
+                    # Update database
+                    update_read_status(self.settings.db_path, record_id, new_status)
+                    
+                    # Update display
+                    record['read'] = 'Yes' if new_status else 'No'
+                    self.records_model.record_changed(row)
+                    
+                    self.status_bar.showMessage(f"Updated read status")
+                    
+                except DatabaseError as e:
+                    QMessageBox.critical(self, "Database Error", f"Failed to update read status: {e}")
+    
+    def on_sort_changed(self):
+        """Reload in the chosen order, replacing any header column sort."""
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.search_timer.start()
     
     def search_records(self):
-        """Perform search with current filters."""
+        """Perform search with current filters, cancelling any pending reload."""
+        self.search_timer.stop()
         self.load_records()
     
     def clear_filters(self):
@@ -1399,13 +1992,11 @@ class MainWindow(QMainWindow):
         self.journal_edit.clear()
         if hasattr(self, 'sort_combo'):
             self.sort_combo.setCurrentIndex(0)  # Reset to "ID (Default)"
-        self.load_records()
+        self.search_records()
     
     def on_selection_changed(self):
         """Handle table selection changes."""
-        selected_rows = set()
-        for item in self.table.selectedItems():
-            selected_rows.add(item.row())
+        selected_rows = self.table.selectionModel().selectedRows()
         
         has_selection = len(selected_rows) > 0
         has_single_selection = len(selected_rows) == 1
@@ -1425,16 +2016,13 @@ class MainWindow(QMainWindow):
         else:
             self.status_bar.showMessage(f"{len(selected_rows)} records selected")
     
-    def get_selected_record_id(self) -> Optional[int]:
-        """Get ID of currently selected record."""
-        current_row = self.table.currentRow()
-        if current_row < 0:
+    def get_selected_record(self) -> Optional[Dict[str, Any]]:
+        """Get the record shown in the current table row."""
+        index = self.table.currentIndex()
+        if not index.isValid():
             return None
         
-        item = self.table.item(current_row, 0)
-        if item:
-            return item.data(Qt.ItemDataRole.UserRole)
-        return None
+        return self.current_records[index.row()]
     
     def add_record(self):
         """Show dialog to add new record."""
@@ -1467,57 +2055,70 @@ class MainWindow(QMainWindow):
     
     def handle_pdf_upload(self, record_id: int, pdf_path: str, record_data: Dict[str, Any]):
         """Handle PDF upload for a new record."""
-        import shutil
         from .unique import unique_name_from_row, NamingScheme
         
         try:
-            # Get the record from database to have the complete data
-            record = get_record(self.settings.db_path, record_id)
-            if not record:
-                raise Exception("Failed to retrieve created record")
-            
-            # Generate unique name using the record data
-            unique_name = unique_name_from_row(record, record_number=record_id, scheme=NamingScheme.HIERARCHICAL)
+            # Generate unique name from the values the record was just created
+            # with; the copy callback then links it with a single UPDATE
+            unique_name = unique_name_from_row(record_data, record_number=record_id, scheme=NamingScheme.HIERARCHICAL)
             
             # Ensure PDF root directory exists
-            pdf_root = self.settings.pdf_root or os.path.join(os.path.dirname(self.settings.db_path), "PDFs")
+            pdf_root = self.pdf_folder()
             os.makedirs(pdf_root, exist_ok=True)
             
             # Create new PDF filename
             new_pdf_filename = f"{unique_name}.pdf"
             new_pdf_path = os.path.join(pdf_root, new_pdf_filename)
             
-            # Copy PDF to the PDFs folder with new name
-            shutil.copy2(pdf_path, new_pdf_path)
-            
-            # Update the record with the unique_name and pdf path
-            update_data = {
-                'unique_name': unique_name,
-                'pdf': new_pdf_filename
-            }
-            update_record(self.settings.db_path, record_id, update_data)
-            
-            self.status_bar.showMessage(f"PDF saved as {new_pdf_filename}")
+            # Copy PDF to the PDFs folder with new name in the background;
+            # the record is linked to it once the copy has succeeded
+            task = PdfCopyTask(pdf_path, new_pdf_path)
+            task.signals.finished.connect(
+                lambda success, error: self.on_pdf_copied(record_id, unique_name, new_pdf_filename, success, error)
+            )
+            QThreadPool.globalInstance().start(task)
+            self.status_bar.showMessage(f"Copying PDF to {new_pdf_filename}...")
             
         except Exception as e:
             # If PDF handling fails, still keep the record but show error
             QMessageBox.warning(self, "PDF Upload Warning", 
                               f"Record created successfully, but PDF upload failed: {e}")
     
+    def on_pdf_copied(self, record_id: int, unique_name: str, pdf_filename: str, success: bool, error: str):
+        """Link a new record to its uploaded PDF once the copy has finished."""
+        if not success:
+            QMessageBox.warning(self, "PDF Upload Warning", 
+                              f"Record created successfully, but PDF upload failed: {error}")
+            return
+        
+        try:
+            set_record_pdf(self.settings.db_path, record_id, unique_name, pdf_filename)
+            _forget_path(os.path.join(self.pdf_folder(), pdf_filename))
+            
+            self.load_records()
+            self.status_bar.showMessage(f"PDF saved as {pdf_filename}")
+            
+        except DatabaseError as e:
+            QMessageBox.warning(self, "PDF Upload Warning", 
+                              f"Record created successfully, but PDF upload failed: {e}")
+    
+    def on_pdfs_deleted(self, success: bool, errors: str):
+        """Report PDF files that could not be removed after a delete."""
+        if not success:
+            self.status_bar.showMessage("Records deleted, but some PDFs could not be deleted")
+            QMessageBox.warning(self, "PDF Deletion Warning", 
+                              f"Records deleted successfully, but some PDFs could not be deleted:\n\n{errors}")
+    
     def edit_record(self):
         """Show dialog to edit selected record."""
-        record_id = self.get_selected_record_id()
-        if not record_id:
+        # The table's record is current: every change reloads the table
+        record = self.get_selected_record()
+        if not record or not record.get('id'):
             return
+        record_id = record['id']
         
         try:
-            record = get_record(self.settings.db_path, record_id)
-            if not record:
-                QMessageBox.warning(self, "Record Not Found", "Selected record no longer exists.")
-                self.load_records()
-                return
-            
-            dialog = RecordDialog(self, record, db_path=self.settings.db_path)
+            dialog = RecordDialog(self, dict(record), db_path=self.settings.db_path)
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 data = dialog.get_data()
                 update_record(self.settings.db_path, record_id, data)
@@ -1529,9 +2130,7 @@ class MainWindow(QMainWindow):
     
     def delete_record(self):
         """Delete selected record(s)."""
-        selected_rows = set()
-        for item in self.table.selectedItems():
-            selected_rows.add(item.row())
+        selected_rows = [index.row() for index in self.table.selectionModel().selectedRows()]
         
         if not selected_rows:
             return
@@ -1560,46 +2159,22 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                deleted_count = 0
-                pdf_deletion_errors = []
+                # Delete all rows in one transaction; their PDF files are
+                # removed in the background afterwards
+                deleted_count, pdf_names = delete_records(self.settings.db_path, record_ids)
                 
-                for record_id in record_ids:
-                    # Get record info before deleting to find associated PDF
-                    record = get_record(self.settings.db_path, record_id)
-                    
-                    # Delete associated PDF file if it exists
-                    if record and record.get('pdf'):
-                        pdf_root = self.settings.pdf_root or os.path.join(os.path.dirname(self.settings.db_path), "PDFs")
-                        pdf_path = os.path.join(pdf_root, record['pdf'])
-                        
-                        if os.path.exists(pdf_path):
-                            try:
-                                os.remove(pdf_path)
-                            except OSError as e:
-                                pdf_deletion_errors.append(f"Could not delete PDF {record['pdf']}: {e}")
-                    
-                    # Delete the database record
-                    delete_record(self.settings.db_path, record_id)
-                    deleted_count += 1
+                if pdf_names:
+                    task = PdfDeleteTask(self.pdf_folder(), pdf_names)
+                    task.signals.finished.connect(self.on_pdfs_deleted)
+                    QThreadPool.globalInstance().start(task)
                 
                 self.load_records()
                 
                 # Show status message
                 if deleted_count == 1:
-                    message = "Record deleted successfully"
+                    self.status_bar.showMessage("Record deleted successfully")
                 else:
-                    message = f"{deleted_count} records deleted successfully"
-                
-                if pdf_deletion_errors:
-                    message += f" (PDF deletion warnings: {'; '.join(pdf_deletion_errors)})"
-                
-                self.status_bar.showMessage(message)
-                
-                # Show PDF deletion warnings if any
-                if pdf_deletion_errors:
-                    QMessageBox.warning(self, "PDF Deletion Warning", 
-                                      f"Records deleted successfully, but some PDFs could not be deleted:\n\n" + 
-                                      "\n".join(pdf_deletion_errors))
+                    self.status_bar.showMessage(f"{deleted_count} records deleted successfully")
                 
             except DatabaseError as e:
                 QMessageBox.critical(self, "Database Error", f"Failed to delete record(s): {e}")
@@ -1608,37 +2183,26 @@ class MainWindow(QMainWindow):
     
     def open_pdf(self):
         """Open PDF file for selected record."""
-        record_id = self.get_selected_record_id()
-        if not record_id:
+        record = self.get_selected_record()
+        if not record:
             return
         
         try:
-            record = get_record(self.settings.db_path, record_id)
-            if not record:
-                return
-            
-            pdf_path = record.get('pdf', '').strip()
+            pdf_path = (record.get('pdf') or '').strip()
             if not pdf_path:
                 QMessageBox.information(self, "No PDF", "No PDF file specified for this record.")
                 return
             
             # Handle relative paths
             if not os.path.isabs(pdf_path):
-                pdf_root = self.settings.pdf_root
-                if pdf_root:
-                    pdf_path = os.path.join(pdf_root, pdf_path)
+                pdf_path = os.path.join(self.pdf_folder(), pdf_path)
             
-            if not os.path.exists(pdf_path):
+            if not _path_exists(pdf_path):
                 QMessageBox.warning(self, "File Not Found", f"PDF file not found: {pdf_path}")
                 return
             
             # Open file with system default application
-            if platform.system() == "Windows":
-                os.startfile(pdf_path)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", pdf_path])
-            else:  # Linux and others
-                subprocess.run(["xdg-open", pdf_path])
+            _open_with_system(pdf_path)
             
             self.status_bar.showMessage(f"Opened PDF: {os.path.basename(pdf_path)}")
             
@@ -1690,6 +2254,7 @@ class MainWindow(QMainWindow):
     
     def on_import_finished(self, success: bool, message: str):
         """Handle import completion."""
+        _forget_path(self.settings.db_path)
         if success:
             QMessageBox.information(self, "Import Complete", message)
             self.load_database()
@@ -1698,9 +2263,18 @@ class MainWindow(QMainWindow):
         
         self.status_bar.showMessage("Import finished")
     
+    def pdf_folder(self) -> str:
+        """Folder holding record PDFs: the configured root, else PDFs/ next to the database."""
+        return self.settings.pdf_root or os.path.join(os.path.dirname(self.settings.db_path), "PDFs")
+    
+    def has_database(self) -> bool:
+        """Whether a database path is configured and the file exists."""
+        db_path = self.settings.db_path
+        return bool(db_path) and _path_exists(db_path)
+    
     def export_csv(self):
         """Export records to CSV file."""
-        if not self.settings.db_path or not os.path.exists(self.settings.db_path):
+        if not self.has_database():
             QMessageBox.warning(self, "No Database", "No database loaded.")
             return
         
@@ -1732,7 +2306,7 @@ class MainWindow(QMainWindow):
     
     def validate_database(self):
         """Validate database integrity."""
-        if not self.settings.db_path or not os.path.exists(self.settings.db_path):
+        if not self.has_database():
             QMessageBox.warning(self, "No Database", "No database loaded.")
             return
         
@@ -1748,7 +2322,7 @@ class MainWindow(QMainWindow):
     
     def show_statistics(self):
         """Show database statistics."""
-        if not self.settings.db_path or not os.path.exists(self.settings.db_path):
+        if not self.has_database():
             QMessageBox.warning(self, "No Database", "No database loaded.")
             return
         
@@ -1773,7 +2347,7 @@ Records by Year:"""
     
     def manage_categories(self):
         """Show categories management dialog."""
-        if not self.settings.db_path or not os.path.exists(self.settings.db_path):
+        if not self.has_database():
             QMessageBox.warning(self, "No Database", "No database loaded.")
             return
         
@@ -1782,14 +2356,12 @@ Records by Year:"""
     
     def export_zotero_dialog(self):
         """Show Zotero export dialog."""
-        if not self.settings.db_path or not os.path.exists(self.settings.db_path):
+        if not self.has_database():
             QMessageBox.warning(self, "No Database", "No database loaded.")
             return
         
         # Check if any records are selected
-        selected_rows = set()
-        for item in self.table.selectedItems():
-            selected_rows.add(item.row())
+        selected_rows = [index.row() for index in self.table.selectionModel().selectedRows()]
         
         if not selected_rows:
             reply = QMessageBox.question(
@@ -1810,7 +2382,7 @@ Records by Year:"""
             return
         
         # Show export dialog
-        dialog = ZoteroExportDialog(self, records_to_export, self.settings.pdf_root)
+        dialog = ZoteroExportDialog(self, records_to_export, self.pdf_folder())
         dialog.exec()
     
     def closeEvent(self, event):
@@ -1819,13 +2391,13 @@ Records by Year:"""
         self.settings.window_geometry = self.saveGeometry()
         self.settings.window_state = self.saveState()
         
-        # Save column widths
-        if self.columns:
-            display_columns = [col for col in self.columns if col not in ['created_at', 'updated_at']]
-            for i, col in enumerate(display_columns):
-                width = self.table.columnWidth(i)
-                self.settings.set_table_column_width(col, width)
+        # Save column widths of the columns actually shown
+        if self.display_columns:
+            self.settings.set_table_column_widths(
+                {col: self.table.columnWidth(i) for i, col in enumerate(self.display_columns)}
+            )
         
+        self.settings.flush()
         event.accept()
 
 
@@ -1844,6 +2416,9 @@ def main():
     window = MainWindow()
     window.show()
     
+    # Warm up the Excel import off the UI thread
+    threading.Thread(target=_load_build_db, name="preload-excel-import", daemon=True).start()
+    
     # Start event loop
     sys.exit(app.exec())
 
@@ -6,40 +6,71 @@ including database path and PDF root directory.
 """
 
 import os
-from typing import Optional
+from collections import deque
+from typing import Any, Deque, Dict, Optional
 from PyQt6.QtCore import QSettings
 
 
 class AppSettings:
     """Wrapper around QSettings for application preferences."""
     
+    # Number of recently opened databases remembered
+    MAX_RECENT_DATABASES = 10
+    
     def __init__(self):
         """Initialize settings with organization and application name."""
         self.settings = QSettings("PapersDB", "Desktop App")
+        # Values read on hot paths (every query, PDF action), by key
+        self._cache: Dict[str, Any] = {}
+        # Recent databases, most recent first; loaded on first use
+        self._recent: Optional[Deque[str]] = None
+    
+    def _cached_value(self, key: str, default: Any = None, value_type: type = None) -> Any:
+        """Read a setting once and serve later reads from memory."""
+        if key not in self._cache:
+            if value_type is None:
+                self._cache[key] = self.settings.value(key, default)
+            else:
+                self._cache[key] = self.settings.value(key, default, type=value_type)
+        return self._cache[key]
+    
+    def flush(self) -> None:
+        """
+        Write pending changes to permanent storage.
+        
+        Setters only update QSettings in memory; Qt writes them out from
+        the event loop and on exit, and this forces it at a known point.
+        """
+        self.settings.sync()
+    
+    def invalidate(self) -> None:
+        """Forget cached values after settings were changed in bulk."""
+        self._cache.clear()
+        self._recent = None
     
     @property
     def db_path(self) -> Optional[str]:
         """Get the database file path."""
-        path = self.settings.value("database/path", None)
+        path = self._cached_value("database/path")
         return path if path else None
     
     @db_path.setter
     def db_path(self, path: str) -> None:
         """Set the database file path."""
         self.settings.setValue("database/path", path)
-        self.settings.sync()
+        self._cache.pop("database/path", None)
     
     @property
     def pdf_root(self) -> Optional[str]:
         """Get the PDF root directory path."""
-        path = self.settings.value("pdf/root", None)
+        path = self._cached_value("pdf/root")
         return path if path else None
     
     @pdf_root.setter
     def pdf_root(self, path: str) -> None:
         """Set the PDF root directory path."""
         self.settings.setValue("pdf/root", path)
-        self.settings.sync()
+        self._cache.pop("pdf/root", None)
     
     @property
     def window_geometry(self) -> Optional[bytes]:
@@ -50,7 +81,6 @@ class AppSettings:
     def window_geometry(self, geometry: bytes) -> None:
         """Set the main window geometry."""
         self.settings.setValue("window/geometry", geometry)
-        self.settings.sync()
     
     @property
     def window_state(self) -> Optional[bytes]:
@@ -61,7 +91,6 @@ class AppSettings:
     def window_state(self, state: bytes) -> None:
         """Set the main window state."""
         self.settings.setValue("window/state", state)
-        self.settings.sync()
     
     @property
     def last_import_dir(self) -> Optional[str]:
@@ -73,7 +102,6 @@ class AppSettings:
     def last_import_dir(self, path: str) -> None:
         """Set the last directory used for importing files."""
         self.settings.setValue("import/last_dir", path)
-        self.settings.sync()
     
     @property
     def last_export_dir(self) -> Optional[str]:
@@ -85,33 +113,43 @@ class AppSettings:
     def last_export_dir(self, path: str) -> None:
         """Set the last directory used for exporting files."""
         self.settings.setValue("export/last_dir", path)
-        self.settings.sync()
     
     @property
     def search_limit(self) -> int:
         """Get the search result limit."""
-        return self.settings.value("search/limit", 1000, type=int)
+        return self._cached_value("search/limit", 1000, int)
     
     @search_limit.setter
     def search_limit(self, limit: int) -> None:
         """Set the search result limit."""
         self.settings.setValue("search/limit", limit)
-        self.settings.sync()
+        self._cache.pop("search/limit", None)
     
     @property
     def table_column_widths(self) -> dict:
         """Get saved table column widths."""
-        widths = {}
-        self.settings.beginGroup("table/columns")
-        for key in self.settings.childKeys():
-            widths[key] = self.settings.value(key, type=int)
-        self.settings.endGroup()
-        return widths
+        widths = self._cache.get("table/columns")
+        if widths is None:
+            widths = {}
+            self.settings.beginGroup("table/columns")
+            for key in self.settings.childKeys():
+                widths[key] = self.settings.value(key, type=int)
+            self.settings.endGroup()
+            self._cache["table/columns"] = widths
+        return dict(widths)
     
     def set_table_column_width(self, column: str, width: int) -> None:
         """Set table column width."""
         self.settings.setValue(f"table/columns/{column}", width)
-        self.settings.sync()
+        self._cache.pop("table/columns", None)
+    
+    def set_table_column_widths(self, widths: Dict[str, int]) -> None:
+        """Set several table column widths in one settings group."""
+        self.settings.beginGroup("table/columns")
+        for column, width in widths.items():
+            self.settings.setValue(column, width)
+        self.settings.endGroup()
+        self._cache.pop("table/columns", None)
     
     def get_default_db_path(self) -> str:
         """Get default database path in user's documents folder."""
@@ -130,7 +168,8 @@ class AppSettings:
     def reset_all(self) -> None:
         """Reset all settings to defaults."""
         self.settings.clear()
-        self.settings.sync()
+        self.flush()
+        self.invalidate()
     
     def export_settings(self, file_path: str) -> bool:
         """
@@ -179,54 +218,55 @@ class AppSettings:
                 value = import_settings.value(key)
                 self.settings.setValue(key, value)
             
-            self.settings.sync()
+            self.flush()
+            self.invalidate()
             return self.settings.status() == QSettings.Status.NoError
             
         except Exception:
             return False
     
+    def _recent_databases(self) -> Deque[str]:
+        """Load the recent databases list once, migrating the old format."""
+        if self._recent is None:
+            stored = self.settings.value("recent/database_paths", "")
+            if stored:
+                paths = stored.split("\n")
+            else:
+                # Older versions kept one numbered key per database
+                self.settings.beginGroup("recent/databases")
+                paths = [self.settings.value(key) for key in sorted(self.settings.childKeys())]
+                self.settings.endGroup()
+                if paths:
+                    self.settings.setValue("recent/database_paths", "\n".join(path for path in paths if path))
+                    self.settings.remove("recent/databases")
+            self._recent = deque((path for path in paths if path), maxlen=self.MAX_RECENT_DATABASES)
+        return self._recent
+    
     def get_recent_databases(self) -> list:
         """Get list of recently opened databases."""
-        recent = []
-        self.settings.beginGroup("recent/databases")
-        for key in sorted(self.settings.childKeys()):
-            path = self.settings.value(key)
-            if path and os.path.exists(path):
-                recent.append(path)
-        self.settings.endGroup()
-        return recent
+        return [path for path in self._recent_databases() if path and os.path.exists(path)]
     
     def add_recent_database(self, db_path: str) -> None:
         """Add database to recent list."""
         if not db_path or not os.path.exists(db_path):
             return
         
-        recent = self.get_recent_databases()
-        
-        # Remove if already in list
-        if db_path in recent:
-            recent.remove(db_path)
+        recent = self._recent_databases()
         
-        # Add to front
-        recent.insert(0, db_path)
+        # Move to front and prune databases that no longer exist, so they
+        # don't hold slots; the deque drops the oldest beyond the limit
+        kept = [path for path in recent if path != db_path and os.path.exists(path)]
+        recent.clear()
+        recent.append(db_path)
+        recent.extend(kept)
         
-        # Keep only last 10
-        recent = recent[:10]
-        
-        # Save back
-        self.settings.beginGroup("recent/databases")
-        self.settings.remove("")  # Clear existing
-        for i, path in enumerate(recent):
-            self.settings.setValue(str(i), path)
-        self.settings.endGroup()
-        self.settings.sync()
+        # Save back as a single value
+        self.settings.setValue("recent/database_paths", "\n".join(recent))
     
     def clear_recent_databases(self) -> None:
         """Clear recent databases list."""
-        self.settings.beginGroup("recent/databases")
-        self.settings.remove("")
-        self.settings.endGroup()
-        self.settings.sync()
+        self._recent_databases().clear()
+        self.settings.remove("recent/database_paths")
 
 
 # Global settings instance
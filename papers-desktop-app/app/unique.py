@@ -11,9 +11,15 @@ The relates_to and project_id fields link to lookup tables:
 - project_id: SYEL (Systematic Review + ML), CANG (Cardiac Bioprinting), etc.
 """
 
-from typing import Dict, Any, Optional
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Any, Optional, Tuple
 from enum import Enum
 
+# Characters dropped from name components; \w matches str.isalnum() plus
+# the underscore, so Unicode letters and digits are kept
+_NON_COMPONENT_CHARS = re.compile(r'[^\w.-]+')
+
 
 class NamingScheme(Enum):
     """Available naming schemes for unique IDs."""
@@ -36,6 +42,47 @@ def unique_name_from_row(row: Dict[str, Any], record_number: Optional[int] = Non
     Returns:
         String with unique identifier or empty string if required fields missing
     """
+    components = _name_components(row, record_number)
+    if components is None:
+        return ""
+    return _format_unique_name(components, scheme)
+
+
+def unique_namer(scheme: NamingScheme = NamingScheme.SEQUENTIAL) -> Callable[[Dict[str, Any], Optional[int]], str]:
+    """
+    Resolve a naming scheme once for naming many rows.
+    
+    Args:
+        scheme: Naming scheme to use
+        
+    Returns:
+        Function taking (row, record_number) that returns the same name as
+        unique_name_from_row(row, record_number, scheme)
+    """
+    # Unknown schemes default to sequential
+    formatter = _SCHEME_FORMATTERS.get(scheme, _format_sequential)
+    
+    def namer(row: Dict[str, Any], record_number: Optional[int] = None) -> str:
+        components = _name_components(row, record_number)
+        if components is None:
+            return ""
+        return formatter(*components)
+    
+    return namer
+
+
+def _name_components(row: Dict[str, Any], record_number: Optional[int]) -> Optional[Tuple[str, str, str, str, int]]:
+    """
+    Extract and format the parts shared by every naming scheme.
+    
+    Args:
+        row: Dictionary containing paper data
+        record_number: Sequential record number
+        
+    Returns:
+        Tuple of (title_tag, relates_to, project_id, year_str, number), or
+        None if required fields are missing
+    """
     # Extract fields
     title = _safe_str(row.get('title', ''))
     relates_to = _safe_str(row.get('relates_to', ''))  # BRNG, FE35, PHHD, OTER
@@ -44,12 +91,12 @@ def unique_name_from_row(row: Dict[str, Any], record_number: Optional[int] = Non
     
     # Check if required fields are present
     if not all([title, relates_to, project_id]):
-        return ""
+        return None
     
     # Generate title tag: first 2 + last 2 letters, uppercase
     title_tag = _generate_title_tag(title)
     if not title_tag:
-        return ""
+        return None
     
     # Format year
     year_str = ""
@@ -59,38 +106,56 @@ def unique_name_from_row(row: Dict[str, Any], record_number: Optional[int] = Non
         except (ValueError, TypeError):
             year_str = ""
     
-    # Format record number as 3-digit string for most schemes
-    number_str = f"{record_number:03d}" if record_number else "001"
-    number_str_4 = f"{record_number:04d}" if record_number else "0001"
+    # Record number, zero-padded to 3 or 4 digits by the scheme that uses it
+    number = record_number or 1
     
-    # Generate unique name based on scheme
-    if scheme == NamingScheme.SEQUENTIAL:
-        # Original Excel format: 0001-PRAI-BRNG-SYEL
-        return f"{number_str_4}-{title_tag}-{relates_to}-{project_id}"
-        
-    elif scheme == NamingScheme.YEAR_BASED:
-        # Year first: 2023-PRAI-BRNG-SYEL
-        if not year_str:
-            return ""
-        return f"{year_str}-{title_tag}-{relates_to}-{project_id}"
-        
-    elif scheme == NamingScheme.HIERARCHICAL:
-        # Category > Project > Number > Title: BRNG-SYEL-001-PRAI
-        return f"{relates_to}-{project_id}-{number_str}-{title_tag}"
-        
-    elif scheme == NamingScheme.PROJECT_FIRST:
-        # Project > Category > Year > Title: SYEL-BRNG-2023-PRAI
-        if not year_str:
-            return f"{project_id}-{relates_to}-{number_str_4}-{title_tag}"
-        return f"{project_id}-{relates_to}-{year_str}-{title_tag}"
-        
-    elif scheme == NamingScheme.SIMPLE:
-        # Simple: BRNG-SYEL-001 (no title)
-        return f"{relates_to}-{project_id}-{number_str}"
-    
-    else:
-        # Default to sequential
-        return f"{number_str_4}-{title_tag}-{relates_to}-{project_id}"
+    return title_tag, relates_to, project_id, year_str, number
+
+
+def _format_sequential(title_tag: str, relates_to: str, project_id: str, year_str: str, number: int) -> str:
+    """Original Excel format: 0001-PRAI-BRNG-SYEL."""
+    return f"{number:04d}-{title_tag}-{relates_to}-{project_id}"
+
+
+def _format_year_based(title_tag: str, relates_to: str, project_id: str, year_str: str, number: int) -> str:
+    """Year first: 2023-PRAI-BRNG-SYEL, empty without a year."""
+    if not year_str:
+        return ""
+    return f"{year_str}-{title_tag}-{relates_to}-{project_id}"
+
+
+def _format_hierarchical(title_tag: str, relates_to: str, project_id: str, year_str: str, number: int) -> str:
+    """Category > Project > Number > Title: BRNG-SYEL-001-PRAI."""
+    return f"{relates_to}-{project_id}-{number:03d}-{title_tag}"
+
+
+def _format_project_first(title_tag: str, relates_to: str, project_id: str, year_str: str, number: int) -> str:
+    """Project > Category > Year > Title: SYEL-BRNG-2023-PRAI, numbered without a year."""
+    if not year_str:
+        return f"{project_id}-{relates_to}-{number:04d}-{title_tag}"
+    return f"{project_id}-{relates_to}-{year_str}-{title_tag}"
+
+
+def _format_simple(title_tag: str, relates_to: str, project_id: str, year_str: str, number: int) -> str:
+    """Simple: BRNG-SYEL-001 (no title)."""
+    return f"{relates_to}-{project_id}-{number:03d}"
+
+
+# Formatter per scheme, looked up once per name instead of an if/elif chain
+_SCHEME_FORMATTERS = {
+    NamingScheme.SEQUENTIAL: _format_sequential,
+    NamingScheme.YEAR_BASED: _format_year_based,
+    NamingScheme.HIERARCHICAL: _format_hierarchical,
+    NamingScheme.PROJECT_FIRST: _format_project_first,
+    NamingScheme.SIMPLE: _format_simple,
+}
+
+
+def _format_unique_name(components: Tuple[str, str, str, str, int], scheme: NamingScheme) -> str:
+    """Build the unique name for one scheme from _name_components output."""
+    # Unknown schemes default to sequential
+    formatter = _SCHEME_FORMATTERS.get(scheme, _format_sequential)
+    return formatter(*components)
 
 
 def _safe_str(value: Any) -> str:
@@ -102,6 +167,7 @@ def _safe_str(value: Any) -> str:
     return str(value).strip()
 
 
+@lru_cache(maxsize=4096)
 def _generate_title_tag(title: str) -> str:
     """
     Generate title tag from first 2 and last 2 letters.
@@ -116,7 +182,7 @@ def _generate_title_tag(title: str) -> str:
         return ""
     
     # Remove non-alphabetic characters and get letters only
-    letters = ''.join(c for c in title if c.isalpha())
+    letters = ''.join(filter(str.isalpha, title))
     
     if len(letters) < 2:
         return ""
@@ -149,7 +215,7 @@ def _clean_component(component: str) -> str:
     
     # Remove or replace characters that might cause issues
     # Keep alphanumeric and basic punctuation
-    cleaned = ''.join(c for c in cleaned if c.isalnum() or c in '.-_')
+    cleaned = _NON_COMPONENT_CHARS.sub('', cleaned)
     
     # Limit length to prevent overly long unique names
     if len(cleaned) > 20:
@@ -175,7 +241,7 @@ def _clean_component_short(component: str) -> str:
     cleaned = component.strip()
     
     # Keep only alphanumeric characters
-    cleaned = ''.join(c for c in cleaned if c.isalnum())
+    cleaned = ''.join(filter(str.isalnum, cleaned))
     
     # Limit to 8 characters max
     if len(cleaned) > 8:
@@ -194,19 +260,16 @@ def validate_unique_name(unique_name: str) -> bool:
     Returns:
         True if valid format, False otherwise
     """
-    if not unique_name:
-        return False
-    
-    parts = unique_name.split('-')
-    if len(parts) != 5:
+    # Cheap checks first: five non-empty parts need at least 15 characters
+    if not unique_name or len(unique_name) < 15 or unique_name.count('-') != 4:
         return False
     
-    year_part, title_part, authors_part, journal_part, doi_part = parts
-    
     # Check year is 4 digits
-    if not (year_part.isdigit() and len(year_part) == 4):
+    if not (unique_name[:4].isdigit() and unique_name[4] == '-'):
         return False
     
+    year_part, title_part, authors_part, journal_part, doi_part = unique_name.split('-')
+    
     # Check title part is 4 uppercase letters
     if not (title_part.isalpha() and len(title_part) == 4 and title_part.isupper()):
         return False
@@ -229,11 +292,19 @@ def preview_naming_schemes(row: Dict[str, Any], record_number: int = 1) -> Dict[
     Returns:
         Dictionary mapping scheme names to generated unique names
     """
+    # Shared parts are extracted once; each scheme only formats them
+    try:
+        components = _name_components(row, record_number)
+    except Exception as e:
+        return {scheme.value: f"Error: {e}" for scheme in NamingScheme}
+    
     schemes = {}
     for scheme in NamingScheme:
+        if components is None:
+            schemes[scheme.value] = ""
+            continue
         try:
-            unique_name = unique_name_from_row(row, record_number, scheme)
-            schemes[scheme.value] = unique_name
+            schemes[scheme.value] = _format_unique_name(components, scheme)
         except Exception as e:
             schemes[scheme.value] = f"Error: {e}"
     
@@ -15,13 +15,22 @@ import os
 import sys
 import pandas as pd
 import re
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 
 # Add parent directory to path so we can import app modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from app.db import init_schema, create_record, DatabaseError
-from app.unique import unique_name_from_row
+from app.db import init_schema, create_record, create_records, DatabaseError
+
+# Rows inserted per transaction
+INSERT_BATCH_SIZE = 500
+
+# Empty rows in a row after which a sheet is taken to have no more data
+BLANK_ROW_RUN = 1000
+
+# Runs of characters replaced by a single space in column names
+_COLUMN_NAME_SEPARATORS = re.compile(r'[\s\n\r/\(\)\[\]\-.]+')
 
 
 def normalize_column_name(name: str) -> str:
@@ -37,14 +46,20 @@ def normalize_column_name(name: str) -> str:
     if not name or pd.isna(name):
         return ""
     
-    # Convert to string and strip whitespace
-    name = str(name).strip()
+    return _normalize_column_text(str(name))
+
+
+@lru_cache(maxsize=1024)
+def _normalize_column_text(name: str) -> str:
+    """Normalize a non-empty column header; headers repeat across sheets and runs."""
+    # Strip whitespace
+    name = name.strip()
     
     # Convert to lowercase
     name = name.lower()
     
     # Replace problematic characters with single space
-    name = re.sub(r'[\s\n\r/\(\)\[\]\-.]+', ' ', name)
+    name = _COLUMN_NAME_SEPARATORS.sub(' ', name)
     
     # Join with underscores
     name = '_'.join(name.split())
@@ -69,6 +84,95 @@ def should_ignore_column(col_name: str) -> bool:
     return str(col_name).startswith('Unnamed')
 
 
+def _read_sheets(excel_file: pd.ExcelFile) -> Dict[str, pd.DataFrame]:
+    """
+    Read every readable sheet of an open workbook.
+    
+    Args:
+        excel_file: Workbook opened with pd.ExcelFile
+        
+    Returns:
+        Dictionary of sheet name to DataFrame, in workbook order
+    """
+    sheets = {}
+    for sheet_name in excel_file.sheet_names:
+        try:
+            sheets[sheet_name] = pd.read_excel(excel_file, sheet_name=sheet_name, header=1)
+        except Exception as e:
+            print(f"Warning: Could not read sheet '{sheet_name}': {e}")
+    return sheets
+
+
+def _sheet_row_counts(excel_path: str) -> Optional[Dict[str, int]]:
+    """
+    Count data rows per sheet without building DataFrames.
+    
+    Uses openpyxl in read-only mode. The recorded sheet dimensions are
+    ignored, since spreadsheet apps often inflate them (formatted but empty
+    rows); rows are counted below the header in row 2 up to the last one
+    holding a value, as read_excel(header=1) does. Scanning stops after
+    BLANK_ROW_RUN consecutive empty rows.
+    
+    Args:
+        excel_path: Path to Excel file
+        
+    Returns:
+        Dictionary of sheet name to row count, or None if the file can't
+        be opened this way (e.g. legacy .xls)
+    """
+    try:
+        from openpyxl import load_workbook
+        workbook = load_workbook(excel_path, read_only=True, data_only=True)
+    except Exception:
+        return None
+    
+    try:
+        counts = {}
+        for worksheet in workbook.worksheets:
+            worksheet.reset_dimensions()
+            last_row = 0
+            for row_number, row in enumerate(worksheet.iter_rows(min_row=3, values_only=True), 1):
+                if any(value is not None and value != '' for value in row):
+                    last_row = row_number
+                elif row_number - last_row >= BLANK_ROW_RUN:
+                    break
+            counts[worksheet.title] = last_row
+        return counts
+    finally:
+        workbook.close()
+
+
+def _select_best_sheet(row_counts: Dict[str, int]) -> str:
+    """Return the name of the sheet with the most rows."""
+    if not row_counts:
+        raise ValueError("No readable sheets found in Excel file")
+    
+    best_sheet = max(row_counts, key=row_counts.get)
+    print(f"Selected sheet '{best_sheet}' with {row_counts[best_sheet]} rows")
+    return best_sheet
+
+
+def _find_best_sheet(excel_path: str, excel_file: pd.ExcelFile) -> Tuple[str, Optional[pd.DataFrame]]:
+    """
+    Find the sheet with the most rows.
+    
+    Args:
+        excel_path: Path to Excel file
+        excel_file: The same workbook opened with pd.ExcelFile
+        
+    Returns:
+        Tuple of (sheet name, its DataFrame if every sheet had to be read
+        to count rows, else None)
+    """
+    row_counts = _sheet_row_counts(excel_path)
+    if row_counts is not None:
+        return _select_best_sheet(row_counts), None
+    
+    sheets = _read_sheets(excel_file)
+    best_sheet = _select_best_sheet({name: len(df) for name, df in sheets.items()})
+    return best_sheet, sheets[best_sheet]
+
+
 def get_best_sheet(excel_path: str) -> str:
     """
     Get the sheet name with the most rows.
@@ -80,26 +184,12 @@ def get_best_sheet(excel_path: str) -> str:
         Name of sheet with most rows
     """
     try:
-        # Get all sheet names and their row counts
-        excel_file = pd.ExcelFile(excel_path)
-        sheet_info = []
-        
-        for sheet_name in excel_file.sheet_names:
-            try:
-                # Read just to get shape
-                df = pd.read_excel(excel_path, sheet_name=sheet_name, header=1)
-                sheet_info.append((sheet_name, len(df)))
-            except Exception as e:
-                print(f"Warning: Could not read sheet '{sheet_name}': {e}")
-                continue
+        row_counts = _sheet_row_counts(excel_path)
+        if row_counts is not None:
+            return _select_best_sheet(row_counts)
         
-        if not sheet_info:
-            raise ValueError("No readable sheets found in Excel file")
-        
-        # Return sheet with most rows
-        best_sheet = max(sheet_info, key=lambda x: x[1])
-        print(f"Selected sheet '{best_sheet[0]}' with {best_sheet[1]} rows")
-        return best_sheet[0]
+        with pd.ExcelFile(excel_path) as excel_file:
+            return _find_best_sheet(excel_path, excel_file)[0]
         
     except Exception as e:
         raise ValueError(f"Failed to analyze Excel file: {e}")
@@ -117,31 +207,34 @@ def read_excel_data(excel_path: str, sheet_name: str = None) -> pd.DataFrame:
         DataFrame with normalized columns
     """
     try:
-        if sheet_name is None:
-            sheet_name = get_best_sheet(excel_path)
-        
-        # Read with header=1 (row 1 contains headers)
-        df = pd.read_excel(excel_path, sheet_name=sheet_name, header=1)
+        # Open the workbook once; only the chosen sheet is parsed
+        with pd.ExcelFile(excel_path) as excel_file:
+            df = None
+            if sheet_name is None:
+                sheet_name, df = _find_best_sheet(excel_path, excel_file)
+            
+            # Read with header=1 (row 1 contains headers)
+            if df is None:
+                df = pd.read_excel(excel_file, sheet_name=sheet_name, header=1)
         
         print(f"Read {len(df)} rows from sheet '{sheet_name}'")
         print(f"Original columns: {list(df.columns)}")
         
         # Filter out columns to ignore
         columns_to_keep = []
-        column_mapping = {}
+        normalized_names = []
         
         for col in df.columns:
             if not should_ignore_column(col):
                 normalized = normalize_column_name(col)
                 if normalized:
                     columns_to_keep.append(col)
-                    column_mapping[col] = normalized
+                    normalized_names.append(normalized)
         
-        # Keep only desired columns
+        # Keep only desired columns, then rename them on the new frame
+        # itself rather than building another one
         df = df[columns_to_keep]
-        
-        # Rename columns
-        df = df.rename(columns=column_mapping)
+        df.columns = normalized_names
         
         print(f"Kept columns: {list(df.columns)}")
         
@@ -162,8 +255,9 @@ def map_excel_columns_to_unique_name(df: pd.DataFrame) -> pd.DataFrame:
     - doi (column 6: 'DOI')
     - year (column 3: 'Year')
     """
-    # Create a copy to avoid modifying original
-    df_mapped = df.copy()
+    # Shallow copy: columns are only replaced, never written into, so the
+    # original is left untouched without duplicating its data
+    df_mapped = df.copy(deep=False)
     
     # Map columns based on the Excel structure we analyzed
     column_mappings = {
@@ -175,24 +269,40 @@ def map_excel_columns_to_unique_name(df: pd.DataFrame) -> pd.DataFrame:
         'relates_to': 'authors',    # 'Relates to' -> 'authors'
     }
     
+    # Find the entirely empty columns among those consulted below in one
+    # pass, then keep the set current as columns are copied
+    consulted = {*column_mappings, *column_mappings.values(), 'journal', 'authors', 'project_id'}
+    consulted = [col for col in df_mapped.columns if col in consulted]
+    empty_columns = set(df_mapped[consulted].columns[df_mapped[consulted].isna().all()])
+    
+    def missing(col: str) -> bool:
+        return col not in df_mapped.columns or col in empty_columns
+    
+    def copy_column(source_col: str, target_col: str) -> None:
+        df_mapped[target_col] = df_mapped[source_col]
+        if source_col in empty_columns:
+            empty_columns.add(target_col)
+        else:
+            empty_columns.discard(target_col)
+    
     # Apply mappings where source columns exist
     for source_col, target_col in column_mappings.items():
         if source_col in df_mapped.columns:
-            if target_col not in df_mapped.columns or df_mapped[target_col].isna().all():
-                df_mapped[target_col] = df_mapped[source_col]
+            if missing(target_col):
+                copy_column(source_col, target_col)
     
     # Ensure we have the required fields for unique_name generation
-    if 'journal' not in df_mapped.columns or df_mapped['journal'].isna().all():
+    if missing('journal'):
         # Use 'published_in' or 'project_id' as journal
         if 'published_in' in df_mapped.columns:
-            df_mapped['journal'] = df_mapped['published_in']
+            copy_column('published_in', 'journal')
         elif 'project_id' in df_mapped.columns:
-            df_mapped['journal'] = df_mapped['project_id']
+            copy_column('project_id', 'journal')
     
-    if 'authors' not in df_mapped.columns or df_mapped['authors'].isna().all():
+    if missing('authors'):
         # Use 'relates_to' as authors
         if 'relates_to' in df_mapped.columns:
-            df_mapped['authors'] = df_mapped['relates_to']
+            copy_column('relates_to', 'authors')
     
     return df_mapped
 
@@ -207,40 +317,105 @@ def clean_data_for_database(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Cleaned DataFrame
     """
-    df_clean = df.copy()
+    # Shallow copy: columns are only replaced, never written into, so the
+    # original is left untouched without duplicating its data
+    df_clean = df.copy(deep=False)
     
     # Convert year to integer where possible
     if 'year' in df_clean.columns:
         df_clean['year'] = pd.to_numeric(df_clean['year'], errors='coerce')
         df_clean['year'] = df_clean['year'].astype('Int64')  # Nullable integer
     
-    # Handle datetime columns - convert to string
+    # Handle datetime columns - convert to string, NaT to empty (masked
+    # from the dates rather than by comparing every string to 'NaT')
     datetime_columns = df_clean.select_dtypes(include=['datetime64', 'datetime']).columns
     for col in datetime_columns:
-        df_clean[col] = df_clean[col].astype(str).replace('NaT', '')
-    
-    # Handle Timestamp columns
-    for col in df_clean.columns:
-        if df_clean[col].dtype.name == 'object':
-            # Check if column contains pandas Timestamps
-            sample_val = df_clean[col].dropna().iloc[0] if not df_clean[col].dropna().empty else None
-            if sample_val is not None and hasattr(sample_val, 'strftime'):
-                # Convert Timestamp to string
-                df_clean[col] = df_clean[col].astype(str).replace('NaT', '')
-    
-    # Clean string fields
-    string_columns = df_clean.select_dtypes(include=['object']).columns
-    for col in string_columns:
-        # Replace NaN with empty string
-        df_clean[col] = df_clean[col].fillna('')
-        # Strip whitespace
-        df_clean[col] = df_clean[col].astype(str).str.strip()
-        # Replace 'nan' string with empty
-        df_clean[col] = df_clean[col].replace('nan', '')
+        values = df_clean[col]
+        df_clean[col] = values.astype(str).where(values.notna(), '')
+    
+    # Clean string fields (object, or str on pandas 3) in one pass: NaN and
+    # NaT to empty, strip whitespace, then 'nan' strings to empty. Timestamps
+    # inside object columns are converted to text here as well
+    string_columns = df_clean.select_dtypes(include=['object', 'string']).columns
+    if len(string_columns):
+        strings = df_clean[string_columns].fillna('').astype(str)
+        cleaned = strings.apply(lambda col: col.str.strip()).replace('nan', '')
+        for col in string_columns:
+            df_clean[col] = cleaned[col]
     
     return df_clean
 
 
+def compute_unique_names(df: pd.DataFrame) -> pd.Series:
+    """
+    Generate sequential-scheme unique names for a whole DataFrame.
+    
+    Column-wise equivalent of unique_name_from_row with
+    NamingScheme.SEQUENTIAL, numbering rows from 1 in DataFrame order
+    (e.g. 0001-PRAI-BRNG-SYEL).
+    
+    Args:
+        df: Cleaned DataFrame with title, relates_to and project_id columns
+        
+    Returns:
+        Series of unique names, empty where a required field is missing
+    """
+    empty = pd.Series('', index=df.index, dtype=object)
+    if not {'title', 'relates_to', 'project_id'}.issubset(df.columns):
+        return empty
+    
+    title = df['title'].fillna('').astype(str)
+    relates_to = df['relates_to'].fillna('').astype(str).str.strip()
+    project_id = df['project_id'].fillna('').astype(str).str.strip()
+    
+    # Title tag: first 2 + last 2 letters, uppercase; a 3-letter title
+    # repeats its last letter. Letters are str.isalpha characters and are
+    # uppercased after slicing, as in _generate_title_tag ('ß' -> 'SS')
+    letters = title.map(lambda text: ''.join(filter(str.isalpha, text)))
+    length = letters.str.len()
+    title_tag = (letters.str[:2] + letters.str[-2:].where(length != 3, letters.str[-1:] * 2)).str.upper()
+    
+    number = pd.Series(range(1, len(df) + 1), index=df.index).astype(str).str.zfill(4)
+    names = number + '-' + title_tag + '-' + relates_to + '-' + project_id
+    
+    valid = (title.str.strip() != '') & (relates_to != '') & (project_id != '') & (length >= 2)
+    return names.where(valid, empty)
+
+
+def deduplicate_unique_names(names: pd.Series, generated: pd.Series) -> pd.Series:
+    """
+    Make unique names distinct before they meet the database's unique index.
+    
+    The first row with a name keeps it; later rows repeating it get their
+    generated name instead, or no name if that is taken too. Each renamed
+    row is reported.
+    
+    Args:
+        names: Unique names per row, '' where there is none
+        generated: Names from compute_unique_names for the same rows
+        
+    Returns:
+        Series of names with no non-empty value repeated
+    """
+    named = names != ''
+    duplicates = named & names.duplicated(keep='first')
+    if not duplicates.any():
+        return names
+    
+    names = names.copy()
+    taken = set(names[named & ~duplicates])
+    for index in names.index[duplicates]:
+        old_name = names[index]
+        new_name = generated[index]
+        if not new_name or new_name in taken:
+            new_name = ''
+        names[index] = new_name
+        if new_name:
+            taken.add(new_name)
+        print(f"  Row {index}: duplicate unique_name '{old_name}' renamed to '{new_name}'")
+    return names
+
+
 def build_db(excel_path: str, db_path: str, sheet_name: str = None) -> None:
     """
     Build SQLite database from Excel file.
@@ -275,6 +450,14 @@ def build_db(excel_path: str, db_path: str, sheet_name: str = None) -> None:
         # Clean data
         df = clean_data_for_database(df)
         
+        # Generate unique names in one column pass, keeping any from Excel
+        generated = compute_unique_names(df)
+        if 'unique_name' in df.columns:
+            df['unique_name'] = df['unique_name'].where(df['unique_name'] != '', generated)
+            df['unique_name'] = deduplicate_unique_names(df['unique_name'], generated)
+        else:
+            df['unique_name'] = generated
+        
         # Initialize database schema
         columns = [col for col in df.columns if col not in ['id', 'unique_name', 'created_at', 'updated_at']]
         print(f"Initializing database with columns: {columns}")
@@ -287,22 +470,34 @@ def build_db(excel_path: str, db_path: str, sheet_name: str = None) -> None:
         
         print(f"Inserting {len(df)} records...")
         
-        for index, row in df.iterrows():
+        for start in range(0, len(df), INSERT_BATCH_SIZE):
+            batch = df.iloc[start:start + INSERT_BATCH_SIZE]
+            rows = batch.to_dict('records')
+            
             try:
-                # Convert row to dictionary
-                record_data = row.to_dict()
-                
-                # Create record
-                create_record(db_path, record_data)
-                success_count += 1
-                
-                if success_count % 10 == 0:
-                    print(f"  Inserted {success_count} records...")
-                    
-            except DatabaseError as e:
-                print(f"  Error inserting row {index}: {e}")
-                error_count += 1
-                continue
+                # One transaction and one prepared statement per batch
+                success_count += create_records(db_path, rows)
+            except DatabaseError:
+                # Retry the failed batch row by row to report the bad rows
+                for index, record_data in zip(batch.index, rows):
+                    try:
+                        create_record(db_path, record_data)
+                        success_count += 1
+                    except DatabaseError as e:
+                        if record_data.get('unique_name') and 'UNIQUE constraint' in str(e):
+                            # Name taken by a record already in the database;
+                            # keep the paper and let it be renamed later
+                            print(f"  Row {index}: unique_name '{record_data['unique_name']}' already exists; inserted without one")
+                            try:
+                                create_record(db_path, {**record_data, 'unique_name': ''})
+                                success_count += 1
+                                continue
+                            except DatabaseError as retry_error:
+                                e = retry_error
+                        print(f"  Error inserting row {index}: {e}")
+                        error_count += 1
+            
+            print(f"  Inserted {success_count} records...")
         
         print(f"Migration complete!")
         print(f"  Successfully inserted: {success_count} records")
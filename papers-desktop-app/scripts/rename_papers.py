@@ -12,19 +12,57 @@ This script can:
 import argparse
 import os
 import sys
+import json
 import sqlite3
-import shutil
-from typing import List, Dict, Any, Optional
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 from pathlib import Path
 
 # Add parent directory to path so we can import app modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from app.unique import (
-    unique_name_from_row, preview_naming_schemes, NamingScheme, 
+    unique_namer, preview_naming_schemes, NamingScheme, 
     get_scheme_description, suggest_best_scheme
 )
-from app.db import get_record, update_record, read_all
+from app.db import get_connection, list_columns
+
+# Rows bound per executemany call when writing new unique names
+UPDATE_BATCH_SIZE = 500
+
+# Per-record report lines buffered before each write to stdout
+REPORT_BATCH_SIZE = 1000
+
+# Records sent to a naming worker process per task with --jobs
+NAME_CHUNK_SIZE = 256
+
+# Threads walking top-level PDF folders in parallel
+WALK_WORKERS = 16
+
+# Format of the PDF folder index saved with --pdf-root
+PDF_INDEX_VERSION = 1
+
+# Folders modified this recently (ns) are read again on the next walk
+PDF_INDEX_RACY_NS = 2_000_000_000
+
+# Folders whose PDFs are renamed in parallel
+RENAME_WORKERS = 8
+
+# Columns read for naming; the rest (abstracts, notes) is never used here
+_NAMING_COLUMNS = ('id', 'title', 'unique_name', 'relates_to', 'project_id', 'year')
+
+
+def _naming_select(db_path: str) -> str:
+    """SELECT of the naming columns this database has, in id order."""
+    existing = set(list_columns(db_path))
+    columns = ', '.join(col for col in _NAMING_COLUMNS if col in existing)
+    return f"SELECT {columns} FROM papers ORDER BY id"
+
+
+def _short_title(title: str, width: int = 50) -> str:
+    """Shorten a title for display, marking the cut with '...'."""
+    return title if len(title) <= width else f"{title[:width]}..."
 
 
 def preview_schemes_for_database(db_path: str, limit: int = 5) -> None:
@@ -39,7 +77,7 @@ def preview_schemes_for_database(db_path: str, limit: int = 5) -> None:
         conn = sqlite3.connect(db_path)
         conn.row_factory = sqlite3.Row
         
-        cursor = conn.execute(f"SELECT * FROM papers ORDER BY id LIMIT {limit}")
+        cursor = conn.execute(f"{_naming_select(db_path)} LIMIT ?", (limit,))
         records = [dict(row) for row in cursor.fetchall()]
         conn.close()
         
@@ -82,13 +120,83 @@ def backup_database(db_path: str) -> str:
     Returns:
         Path to backup file
     """
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(db_path)
+    
+    # SQLite's online backup copies a consistent snapshot, including
+    # changes still in the WAL file, where a file copy could tear
     backup_path = f"{db_path}.backup"
-    shutil.copy2(db_path, backup_path)
+    source = sqlite3.connect(db_path)
+    try:
+        target = sqlite3.connect(backup_path)
+        try:
+            source.backup(target, pages=1024)
+        finally:
+            target.close()
+    finally:
+        source.close()
     print(f"Database backed up to: {backup_path}")
     return backup_path
 
 
-def update_unique_names(db_path: str, scheme: NamingScheme, dry_run: bool = True) -> Dict[str, Any]:
+# Namer for the scheme of the current run, set once in each worker process
+_worker_namer = None
+
+
+def _init_naming_worker(scheme: NamingScheme) -> None:
+    """Resolve the naming scheme once when a worker process starts."""
+    global _worker_namer
+    _worker_namer = unique_namer(scheme)
+
+
+def _name_record(record: Dict[str, Any], record_number: int) -> Tuple[str, Optional[str]]:
+    """
+    Name one record in a worker process.
+    
+    Returns:
+        Tuple of (unique name, error message or None)
+    """
+    try:
+        return _worker_namer(record, record_number), None
+    except Exception as e:
+        return "", str(e)
+
+
+def _name_records(records: Iterator[Dict[str, Any]], scheme: NamingScheme, jobs: int = 1) -> Iterator[Tuple[Dict[str, Any], Tuple[str, Optional[str]]]]:
+    """
+    Compute unique names for records numbered from 1, in order.
+    
+    With one job, records are named here as they are read. With more,
+    they are collected and named in a process pool, NAME_CHUNK_SIZE
+    records per task to keep inter-process traffic down.
+    
+    Args:
+        records: Records in id order
+        scheme: Naming scheme to use
+        jobs: Number of worker processes
+        
+    Yields:
+        Tuples of (record, (unique name, error message or None))
+    """
+    if jobs <= 1:
+        namer = unique_namer(scheme)
+        for i, record in enumerate(records, 1):
+            try:
+                yield record, (namer(record, i), None)
+            except Exception as e:
+                yield record, ("", str(e))
+        return
+    
+    records = list(records)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_naming_worker, initargs=(scheme,)) as executor:
+        results = executor.map(
+            _name_record, records, range(1, len(records) + 1),
+            chunksize=NAME_CHUNK_SIZE
+        )
+        yield from zip(records, results)
+
+
+def update_unique_names(db_path: str, scheme: NamingScheme, dry_run: bool = True, jobs: int = 1) -> Dict[str, Any]:
     """
     Update unique names in the database using the specified scheme.
     
@@ -96,78 +204,116 @@ def update_unique_names(db_path: str, scheme: NamingScheme, dry_run: bool = True
         db_path: Path to SQLite database
         scheme: Naming scheme to use
         dry_run: If True, only show what would be changed without making changes
+        jobs: Worker processes for naming; 1 names records in this process
+            as they are read
         
     Returns:
         Dictionary with update statistics
     """
     try:
+        # Plain tuples: each is zipped straight into the one dict the namer
+        # needs, without an intermediate sqlite3.Row
         conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        
-        # Get all records
-        cursor = conn.execute("SELECT * FROM papers ORDER BY id")
-        records = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        
-        if not records:
-            return {"error": "No records found"}
         
         updates = []
         errors = []
+        total_records = 0
+        # Names of records that keep their current one, by name
+        kept_names = {}
         
         print(f"\n{'DRY RUN - ' if dry_run else ''}Updating unique names with scheme: {scheme.value.upper()}")
         print("=" * 100)
         
-        for i, record in enumerate(records, 1):
-            try:
-                old_name = record.get('unique_name', '')
-                new_name = unique_name_from_row(record, i, scheme)
-                
-                if new_name and new_name != old_name:
-                    updates.append({
+        try:
+            rows = conn.execute(_naming_select(db_path))
+            columns = [description[0] for description in rows.description]
+            records = (dict(zip(columns, row)) for row in rows)
+            for total_records, (record, (new_name, error)) in enumerate(_name_records(records, scheme, jobs), 1):
+                if error:
+                    errors.append({
                         'id': record['id'],
-                        'old_name': old_name,
-                        'new_name': new_name,
-                        'title': record['title'][:50] + '...' if len(record['title']) > 50 else record['title']
+                        'error': error,
+                        'title': record.get('title', 'Unknown')
                     })
+                    if record.get('unique_name'):
+                        kept_names.setdefault(record['unique_name'], record['id'])
+                    continue
+                
+                try:
+                    old_name = record.get('unique_name', '')
                     
-                    print(f"Record {record['id']:3}: {old_name:30} → {new_name}")
-                    
-                    # Actually update if not dry run
-                    if not dry_run:
-                        update_record(db_path, record['id'], {'unique_name': new_name})
+                    if new_name and new_name != old_name:
+                        updates.append({
+                            'id': record['id'],
+                            'old_name': old_name,
+                            'new_name': new_name,
+                            'title': record['title']
+                        })
+                        
+                        continue
+                        
+                    elif not new_name:
+                        errors.append({
+                            'id': record['id'],
+                            'error': 'Could not generate unique name',
+                            'title': record['title']
+                        })
                         
-                elif not new_name:
+                except Exception as e:
                     errors.append({
                         'id': record['id'],
-                        'error': 'Could not generate unique name',
-                        'title': record['title'][:50] + '...' if len(record['title']) > 50 else record['title']
+                        'error': str(e),
+                        'title': record.get('title', 'Unknown')
                     })
-                    
-            except Exception as e:
-                errors.append({
-                    'id': record['id'],
-                    'error': str(e),
-                    'title': record.get('title', 'Unknown')[:50]
-                })
+                
+                if record.get('unique_name'):
+                    kept_names.setdefault(record['unique_name'], record['id'])
+        finally:
+            conn.close()
+        
+        if not total_records:
+            return {"error": "No records found"}
+        
+        # Names that would collide (e.g. two papers of the same year with
+        # the same title tag under year_based) are caught before writing
+        planned = len(updates)
+        updates = _reject_duplicate_names(updates, kept_names, errors)
+        failed = planned - len(updates)
+        
+        # Per-record lines, written out in batches rather than one print each
+        for start in range(0, len(updates), REPORT_BATCH_SIZE):
+            sys.stdout.write(''.join(
+                f"Record {update['id']:3}: {update['old_name']:30} → {update['new_name']}\n"
+                for update in updates[start:start + REPORT_BATCH_SIZE]
+            ))
+        
+        # Actually update if not dry run; only applied updates are returned,
+        # so PDFs are never renamed for records whose name wasn't saved
+        if not dry_run and updates:
+            failed_ids = apply_unique_names(db_path, updates, errors)
+            if failed_ids:
+                failed += len(failed_ids)
+                updates = [update for update in updates if update['id'] not in failed_ids]
         
         stats = {
-            'total_records': len(records),
+            'total_records': total_records,
             'updates': len(updates),
             'errors': len(errors),
-            'unchanged': len(records) - len(updates) - len(errors)
+            'failed': failed,
+            'unchanged': total_records - len(updates) - len(errors)
         }
         
         print(f"\nSummary:")
         print(f"  Total records: {stats['total_records']}")
         print(f"  Updates needed: {stats['updates']}")
         print(f"  Errors: {stats['errors']}")
+        print(f"  Failed updates: {stats['failed']}")
         print(f"  Unchanged: {stats['unchanged']}")
         
         if errors:
             print(f"\nErrors:")
             for error in errors:
-                print(f"  Record {error['id']}: {error['error']} - {error['title']}")
+                print(f"  Record {error['id']}: {error['error']} - {_short_title(error['title'])}")
         
         return {
             'stats': stats,
@@ -179,13 +325,251 @@ def update_unique_names(db_path: str, scheme: NamingScheme, dry_run: bool = True
         return {"error": f"Database error: {e}"}
 
 
-def find_pdf_files(pdf_root: str, old_names: List[str]) -> Dict[str, str]:
+def _reject_duplicate_names(updates: List[Dict[str, Any]], kept_names: Dict[str, int], errors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Drop updates whose new name another record would also hold.
+    
+    Records keeping their name have precedence, then earlier updates. A
+    dropped update keeps its old name, which may in turn block another
+    update, so this repeats until nothing more is dropped.
+    
+    Args:
+        updates: Update dictionaries with id, old_name, new_name and title
+        kept_names: Names of records not being renamed, mapped to their id
+        errors: List that dropped updates are appended to
+        
+    Returns:
+        The updates that can be written without a collision
+    """
+    rejected = {}
+    while True:
+        owners = dict(kept_names)
+        for update in updates:
+            if update['id'] in rejected and update['old_name']:
+                owners.setdefault(update['old_name'], update['id'])
+        
+        newly_rejected = False
+        for update in updates:
+            if update['id'] in rejected:
+                continue
+            owner = owners.setdefault(update['new_name'], update['id'])
+            if owner != update['id']:
+                rejected[update['id']] = owner
+                newly_rejected = True
+                break
+        if not newly_rejected:
+            break
+    
+    for update in updates:
+        if update['id'] in rejected:
+            errors.append({
+                'id': update['id'],
+                'error': f"Duplicate unique name {update['new_name']} (also record {rejected[update['id']]})",
+                'title': update['title']
+            })
+    return [update for update in updates if update['id'] not in rejected]
+
+
+def apply_unique_names(db_path: str, updates: List[Dict[str, Any]], errors: List[Dict[str, Any]]) -> Set[int]:
+    """
+    Write new unique names in a single transaction.
+    
+    Names are bound UPDATE_BATCH_SIZE at a time to one prepared UPDATE. A
+    batch that fails (e.g. a unique_name collision) is retried row by row
+    so each failing record is reported while the others are still saved.
+    
+    Args:
+        db_path: Path to SQLite database
+        updates: Update dictionaries with id, new_name and title
+        errors: List that failed updates are appended to
+        
+    Returns:
+        Ids of the records whose update failed
+    """
+    failed_ids = set()
+    # Rows already holding the name (e.g. renamed since they were read) are
+    # left alone, so their updated_at isn't bumped for nothing
+    query = (
+        "UPDATE papers SET unique_name = ?, updated_at = datetime('now') "
+        "WHERE id = ? AND unique_name IS NOT ?"
+    )
+    conn = get_connection(db_path)
+    
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        
+        for start in range(0, len(updates), UPDATE_BATCH_SIZE):
+            batch = updates[start:start + UPDATE_BATCH_SIZE]
+            params = [(update['new_name'], update['id'], update['new_name']) for update in batch]
+            
+            try:
+                conn.executemany(query, params)
+            except sqlite3.Error:
+                # A failed statement doesn't end the transaction; rows applied
+                # before it are rewritten with the same values
+                for update, param in zip(batch, params):
+                    try:
+                        conn.execute(query, param)
+                    except sqlite3.Error as e:
+                        failed_ids.add(update['id'])
+                        errors.append({
+                            'id': update['id'],
+                            'error': str(e),
+                            'title': update['title']
+                        })
+        
+        conn.commit()
+        return failed_ids
+        
+    except Exception:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+
+def _scan_folder(directory: str, index: Optional[Dict[str, Any]] = None, listings: Optional[Dict[str, Any]] = None) -> Tuple[List[str], List[str]]:
+    """
+    List one folder's PDF files and the subfolders to descend into.
+    
+    Uses os.scandir so the file type comes from the directory listing
+    instead of a stat per entry. Unreadable folders and symlinked folders
+    are skipped, as os.walk does by default. A folder whose modification
+    time matches its entry in index is not read again, since adding,
+    removing or renaming files in it changes that time.
+    
+    Args:
+        directory: Directory to list
+        index: Listings from a previous walk, by folder path
+        listings: Dictionary this folder's listing is recorded in
+        
+    Returns:
+        Tuple of (names of files ending in .pdf in any case, subfolder paths)
+    """
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return [], []
+    
+    cached = index.get(directory) if index else None
+    if cached and cached['mtime'] == mtime:
+        pdf_names, subdirs = cached['pdfs'], cached['dirs']
+    else:
+        pdf_names = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name[-4:].lower() == '.pdf':
+                        pdf_names.append(entry.name)
+        except OSError:
+            return [], []
+    
+    if listings is not None:
+        # A folder changed within the last moments may change again without
+        # its time moving on; leave it unmatched so the next walk reads it
+        racy = time.time_ns() - mtime < PDF_INDEX_RACY_NS
+        listings[directory] = {'mtime': None if racy else mtime, 'pdfs': pdf_names, 'dirs': subdirs}
+    return pdf_names, subdirs
+
+
+def _iter_pdf_files(directory: str, index: Optional[Dict[str, Any]] = None, listings: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[str, str]]:
+    """
+    Yield the PDF files under a directory, in the order os.walk visits them.
+    
+    Args:
+        directory: Directory to search
+        index: Listings from a previous walk, by folder path
+        listings: Dictionary each folder's listing is recorded in
+        
+    Yields:
+        Tuples of (folder path, file name) for files ending in .pdf (any case)
+    """
+    pdf_names, subdirs = _scan_folder(directory, index, listings)
+    for name in pdf_names:
+        yield directory, name
+    for subdir in subdirs:
+        yield from _iter_pdf_files(subdir, index, listings)
+
+
+def load_pdf_index(index_path: str, pdf_root: str) -> Dict[str, Any]:
+    """
+    Load folder listings saved by a previous walk of pdf_root.
+    
+    Args:
+        index_path: Path to the index file
+        pdf_root: Root directory the listings must belong to
+        
+    Returns:
+        Listings by folder path, or an empty dictionary if there is no
+        usable index for this root
+    """
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    # A corrupt or hand-edited file falls back to a full walk
+    if not isinstance(data, dict):
+        return {}
+    directories = data.get('directories')
+    if (data.get('version') != PDF_INDEX_VERSION
+            or data.get('pdf_root') != os.path.abspath(pdf_root)
+            or not isinstance(directories, dict)):
+        return {}
+    return {
+        directory: listing
+        for directory, listing in directories.items()
+        if isinstance(listing, dict)
+        and isinstance(listing.get('mtime'), (int, type(None)))
+        and isinstance(listing.get('pdfs'), list)
+        and isinstance(listing.get('dirs'), list)
+    }
+
+
+def save_pdf_index(index_path: str, pdf_root: str, listings: Dict[str, Any]) -> None:
+    """
+    Save folder listings so the next walk of pdf_root can reuse them.
+    
+    The file is written next to its final path and moved into place, so
+    an interrupted save leaves the previous index intact.
+    
+    Args:
+        index_path: Path to the index file
+        pdf_root: Root directory that was walked
+        listings: Listings by folder path
+    """
+    data = {
+        'version': PDF_INDEX_VERSION,
+        'pdf_root': os.path.abspath(pdf_root),
+        'directories': listings,
+    }
+    temp_path = f"{index_path}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_path, index_path)
+    except OSError as e:
+        print(f"Warning: could not save PDF index {index_path}: {e}")
+
+
+def find_pdf_files(pdf_root: str, old_names: List[str], index_path: Optional[str] = None, save_index: bool = True) -> Dict[str, str]:
     """
     Find PDF files that match the old unique names.
     
     Args:
         pdf_root: Root directory to search for PDFs
         old_names: List of old unique names to look for
+        index_path: Optional file caching folder listings between runs;
+            only folders modified since the last run are read again
+        save_index: If False, the index is only read, never written
         
     Returns:
         Dictionary mapping old names to found file paths
@@ -193,24 +577,130 @@ def find_pdf_files(pdf_root: str, old_names: List[str]) -> Dict[str, str]:
     if not os.path.exists(pdf_root):
         return {}
     
-    found_files = {}
+    index = load_pdf_index(index_path, pdf_root) if index_path else None
     
-    # Search for PDF files
-    for root, dirs, files in os.walk(pdf_root):
-        for file in files:
-            if file.lower().endswith('.pdf'):
-                file_path = os.path.join(root, file)
-                file_name = os.path.splitext(file)[0]
-                
-                # Check if filename matches any old unique name
-                for old_name in old_names:
-                    if old_name and (file_name == old_name or old_name in file_name):
-                        found_files[old_name] = file_path
-                        break
+    # Position of each name, so the earliest listed name wins when a file
+    # contains several; names are matched by probing the file name's
+    # substrings of each name length instead of scanning every name
+    name_order = {}
+    for position, old_name in enumerate(old_names):
+        if old_name:
+            name_order.setdefault(old_name, position)
+    name_lengths = sorted({len(name) for name in name_order})
+    
+    def match_files(files) -> Dict[str, str]:
+        found = {}
+        for directory, name in files:
+            file_name = name[:-4]
+            
+            # Check if filename matches (or contains) any old unique name
+            matches = [
+                file_name[start:start + length]
+                for length in name_lengths
+                for start in range(len(file_name) - length + 1)
+                if file_name[start:start + length] in name_order
+            ]
+            if matches:
+                found[min(matches, key=name_order.get)] = os.path.join(directory, name)
+        return found
+    
+    def walk_subtree(subdir: str) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        subtree_listings = {}
+        return match_files(_iter_pdf_files(subdir, index, subtree_listings)), subtree_listings
+    
+    # Search for PDF files: the root's own files here, each top-level
+    # folder on a worker thread so directory reads on network storage
+    # overlap. Results are merged in walk order, so the same file wins
+    # as with a single sequential walk.
+    listings = {}
+    root_names, subdirs = _scan_folder(pdf_root, index, listings)
+    found_files = match_files((pdf_root, name) for name in root_names)
+    if subdirs:
+        with ThreadPoolExecutor(max_workers=min(WALK_WORKERS, len(subdirs))) as executor:
+            for found, subtree_listings in executor.map(walk_subtree, subdirs):
+                found_files.update(found)
+                listings.update(subtree_listings)
+    
+    if index_path and save_index:
+        save_pdf_index(index_path, pdf_root, listings)
     
     return found_files
 
 
+def _rename_no_replace(old_path: str, new_path: str) -> None:
+    """
+    Rename a file, failing instead of overwriting an existing target.
+    
+    On POSIX the new name is hard-linked and the old one unlinked, so the
+    existence check and the rename are one atomic step. Windows' os.rename
+    already refuses existing targets. Filesystems without hard links fall
+    back to checking first.
+    
+    Args:
+        old_path: Current file path
+        new_path: Path to rename it to
+        
+    Raises:
+        FileExistsError: If new_path already exists
+    """
+    if os.name == 'nt':
+        os.rename(old_path, new_path)
+        return
+    
+    try:
+        os.link(old_path, new_path)
+    except FileExistsError:
+        raise
+    except OSError:
+        # No hard links here (e.g. FAT or some network shares)
+        if os.path.exists(new_path):
+            raise FileExistsError(new_path)
+        os.rename(old_path, new_path)
+        return
+    os.unlink(old_path)
+
+
+def _fsync_directory(directory: str) -> None:
+    """Flush a folder's entries to disk so renames in it survive a crash."""
+    if os.name == 'nt':
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _rename_batch(pairs: List[Tuple[str, str]]) -> List[Optional[str]]:
+    """
+    Rename files within one folder in order, then make the renames durable.
+    
+    Args:
+        pairs: (old_path, new_path) pairs in the same folder
+        
+    Returns:
+        Error message for each pair, or None where the rename succeeded
+    """
+    results = []
+    for old_path, new_path in pairs:
+        try:
+            _rename_no_replace(old_path, new_path)
+            results.append(None)
+        except FileExistsError:
+            results.append(f"Target file already exists: {new_path}")
+        except Exception as e:
+            results.append(f"Error renaming {old_path}: {e}")
+    
+    if None in results:
+        _fsync_directory(os.path.dirname(pairs[0][0]))
+    return results
+
+
 def rename_pdf_files(pdf_mappings: Dict[str, str], name_updates: List[Dict], dry_run: bool = True) -> Dict[str, Any]:
     """
     Rename PDF files to match new unique names.
@@ -225,6 +715,8 @@ def rename_pdf_files(pdf_mappings: Dict[str, str], name_updates: List[Dict], dry
     """
     renames = []
     errors = []
+    # Planned (old_path, new_path) pairs per folder, in update order
+    batches: Dict[str, List[Tuple[str, str]]] = {}
     
     print(f"\n{'DRY RUN - ' if dry_run else ''}PDF File Renaming:")
     print("=" * 100)
@@ -239,18 +731,19 @@ def rename_pdf_files(pdf_mappings: Dict[str, str], name_updates: List[Dict], dry
             extension = os.path.splitext(old_path)[1]
             new_path = os.path.join(directory, new_name + extension)
             
-            try:
-                print(f"  {os.path.basename(old_path)} → {os.path.basename(new_path)}")
-                
-                if not dry_run:
-                    if os.path.exists(new_path):
-                        errors.append(f"Target file already exists: {new_path}")
+            print(f"  {os.path.basename(old_path)} → {os.path.basename(new_path)}")
+            batches.setdefault(directory, []).append((old_path, new_path))
+    
+    # Folders are renamed in parallel; within one folder renames keep their
+    # order, since one may free the name the next one takes
+    if not dry_run and batches:
+        with ThreadPoolExecutor(max_workers=min(RENAME_WORKERS, len(batches))) as executor:
+            for batch, batch_errors in zip(batches.values(), executor.map(_rename_batch, batches.values())):
+                for (old_path, new_path), error in zip(batch, batch_errors):
+                    if error:
+                        errors.append(error)
                     else:
-                        os.rename(old_path, new_path)
                         renames.append({'old': old_path, 'new': new_path})
-                        
-            except Exception as e:
-                errors.append(f"Error renaming {old_path}: {e}")
     
     stats = {
         'total_pdfs_found': len(pdf_mappings),
@@ -298,6 +791,8 @@ Examples:
     parser.add_argument('--execute', action='store_true', help='Actually perform the changes')
     parser.add_argument('--backup', action='store_true', help='Create database backup before changes')
     parser.add_argument('--limit', type=int, default=5, help='Number of records to preview (default: 5)')
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes for computing names (default: 1)')
+    parser.add_argument('--pdf-index', help='File caching PDF folder listings between runs (saved with --execute only)')
     
     args = parser.parse_args()
     
@@ -328,24 +823,30 @@ Examples:
         backup_database(args.db)
     
     # Update unique names
-    result = update_unique_names(args.db, scheme, dry_run)
+    result = update_unique_names(args.db, scheme, dry_run, args.jobs)
     
     if 'error' in result:
         print(f"Error: {result['error']}")
         sys.exit(1)
     
+    failures = result['stats']['failed']
+    
     # Rename PDFs if requested
     if args.pdf_root and result['updates']:
         old_names = [update['old_name'] for update in result['updates']]
-        pdf_mappings = find_pdf_files(args.pdf_root, old_names)
+        pdf_mappings = find_pdf_files(args.pdf_root, old_names, args.pdf_index, save_index=not dry_run)
         
         if pdf_mappings:
-            rename_pdf_files(pdf_mappings, result['updates'], dry_run)
+            pdf_result = rename_pdf_files(pdf_mappings, result['updates'], dry_run)
+            failures += len(pdf_result['errors'])
         else:
             print(f"\nNo PDF files found in {args.pdf_root}")
     
     if dry_run:
         print(f"\nTo execute these changes, run with --execute")
+    elif failures:
+        print(f"\nChanges completed with {failures} failures; see the errors above")
+        sys.exit(1)
     else:
         print(f"\nChanges completed successfully!")
 
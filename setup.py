@@ -5,17 +5,19 @@ A scientific literature management system
 """
 
 from setuptools import setup, find_packages
-import os
+from pathlib import Path
+
+# Files are read relative to this script, not the current directory
+HERE = Path(__file__).resolve().parent
 
 # Read the README file
 def read_readme():
-    with open("README.md", "r", encoding="utf-8") as fh:
-        return fh.read()
+    return (HERE / "README.md").read_text(encoding="utf-8")
 
 # Read requirements
 def read_requirements():
-    with open("requirements.txt", "r", encoding="utf-8") as fh:
-        return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+    lines = (HERE / "requirements.txt").read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
 
 setup(
     name="papers-database",